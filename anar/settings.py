@@ -157,6 +157,10 @@ LOGGING = {
             'level': 'ERROR',
             'filters': ['require_debug_false'],
             'class': 'django.utils.log.AdminEmailHandler'
+        },
+        'console': {
+            'level': 'DEBUG',
+            'class': 'logging.StreamHandler'
         }
     },
     'loggers': {
@@ -165,6 +169,12 @@ LOGGING = {
             'level': 'ERROR',
             'propagate': True,
         },
+        # Consulta final de cada busqueda, solo se registra con DEBUG = True
+        'anarapp.busqueda': {
+            'handlers': ['console'],
+            'level': 'DEBUG',
+            'propagate': False,
+        },
     }
 }
 
@@ -172,12 +182,28 @@ HAYSTACK_CONNECTIONS = {
     'default': {
         #'ENGINE': 'xapian_backend.XapianEngine',
         #'PATH': os.path.join(os.path.dirname(__file__), 'xapian_index'),
-        'ENGINE': 'haystack.backends.whoosh_backend.WhooshEngine',
+        # Whoosh con analizador sin acentos y con raices en español (anarapp.whoosh_backend)
+        'ENGINE': 'anarapp.whoosh_backend.AnarWhooshEngine',
         'PATH': os.path.join(os.path.dirname(__file__), 'whoosh_index'),
         'EXCLUDED_INDEXES': ['anarapp.search_indexes.BaseIndex'],
+        # Busqueda de texto completo en PostgreSQL (anarapp.postgres_backend), compartida
+        # por todos los servidores de la aplicacion:
+        #'ENGINE': 'anarapp.postgres_backend.PostgresEngine',
+        #'DATABASE': 'default',
     },
 }
 
+# Cache de los reportes de cruces. Se usa un backend de archivos para que la version
+# de los datos que incrementa el admin la vean todos los procesos; con un solo proceso
+# tambien sirve 'django.core.cache.backends.locmem.LocMemCache'
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(os.path.dirname(__file__), 'cache'),
+        'TIMEOUT': 60 * 60 * 24,
+    }
+}
+
 TEMPLATE_CONTEXT_PROCESSORS = TCP + (
     "django.core.context_processors.request",    
 )
@@ -24,6 +24,13 @@ urlpatterns = patterns('',
 		
 	# Incluyendo los cruces
 	url(r'^cruces/', include('joins.urls', namespace='joins')),
+
+	# Incluyendo el mapa de yacimientos
+	url(r'^mapa/', include('geoespacial.urls', namespace='geoespacial')),
+
+	# Exportacion de la capa de yacimientos
+	url(r'^export/sitios\.geojson$', 'geoespacial.views.sitios_geojson', name='sitios_geojson'),
+	url(r'^export/sitios\.kml$', 'geoespacial.views.sitios_kml', name='sitios_kml'),
 	
 
 )
@@ -1,7 +1,19 @@
 # -*- coding: utf-8 -*-
 
+import json
+
+from django.conf.urls import patterns, url
 from django.contrib import admin
-from anarapp import forms
+from django.contrib.admin import helpers
+from django.contrib.admin.util import unquote
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.http import Http404, HttpResponse, HttpResponseBadRequest, HttpResponseNotAllowed
+from django.template.response import TemplateResponse
+from django.utils.encoding import force_unicode
+from anarapp import forms, secciones
+from anarapp.listados import BusquedaChangeList
+from anarapp.paginacion import PaginadorAproximado
 
 # Importar los modelos necesarios empezando por los de yacimiento
 from anarapp.models import Yacimiento, LocalidadYacimiento, UsoActSuelo, TenenciaDeTierra, Indicaciones, Croquis, Plano , \
@@ -609,18 +621,214 @@ class SupervisadaPorPiedraInline(admin.TabularInline):
     suit_classes = 'suit-tab suit-tab-observaciones'
 
 
+########################################################################################
+# Carga de inlines por pestaña
+########################################################################################
+
+class PestanasAdmin(admin.ModelAdmin):
+
+    """ Administrador que solo construye los inlines de las pestañas de suit pedidas.
+    El formulario abre con la pestaña inicial y admin.js trae las demas desde la url
+    <id>/pestana/<nombre>/ al abrirlas por primera vez. Al guardar, el campo pestanas
+    indica que pestañas se enviaron y solo se procesan sus formsets.
+
+    Cada inline tambien se puede guardar solo, con su version (ver anarapp.secciones),
+    enviandolo a <id>/seccion/<prefijo>/ """
+
+    pestana_inicial = 'generales'
+
+    def pestana_de(self, inline):
+        for clase in getattr(inline, 'suit_classes', '').split():
+            if clase.startswith('suit-tab-'):
+                return clase[len('suit-tab-'):]
+        return None
+
+    def pestanas_pedidas(self, request):
+        if hasattr(request, 'pestanas'):
+            return request.pestanas
+        if request.method == 'POST':
+            return request.POST.getlist('pestanas') or [self.pestana_inicial]
+        return [request.GET.get('pestana', self.pestana_inicial)]
+
+    def get_inline_instances(self, request):
+        inlines = super(PestanasAdmin, self).get_inline_instances(request)
+        pestanas = self.pestanas_pedidas(request)
+        inlines = [inline for inline in inlines if self.pestana_de(inline) in pestanas or self.pestana_de(inline) is None]
+        if request.method == 'POST':
+            # Un formset sin su formulario de gestion en el POST no se envio (la pestaña
+            # pedida no trajo ese inline) y Django fallaria al construirlo
+            enviados = self.inlines_enviados(request)
+            inlines = [inline for inline in inlines if type(inline) in enviados]
+        return inlines
+
+    def inlines_enviados(self, request):
+        """ Clases de los inlines cuyo formset llego en el POST """
+
+        return set(type(inline) for inline, FormSet, prefix in self.formsets_inlines(request, None)
+            if prefix + '-TOTAL_FORMS' in request.POST)
+
+    def get_urls(self):
+        info = self.model._meta.app_label, self.model._meta.module_name
+        return patterns('',
+            url(r'^(.+)/pestana/(\w+)/$', self.admin_site.admin_view(self.pestana_view),
+                name='%s_%s_pestana' % info),
+            url(r'^(.+)/seccion/([\w-]+)/$', self.admin_site.admin_view(self.seccion_view),
+                name='%s_%s_seccion' % info),
+        ) + super(PestanasAdmin, self).get_urls()
+
+    def formsets_inlines(self, request, obj):
+        """ Retorna (inline, FormSet, prefijo) de todos los inlines, con los prefijos
+        numerados como en change_view para que coincidan al guardar """
+
+        prefixes = {}
+        for inline in super(PestanasAdmin, self).get_inline_instances(request):
+            FormSet = inline.get_formset(request, obj)
+            prefix = FormSet.get_default_prefix()
+            prefixes[prefix] = prefixes.get(prefix, 0) + 1
+            if prefixes[prefix] != 1 or not prefix:
+                prefix = "%s-%s" % (prefix, prefixes[prefix])
+            yield inline, FormSet, prefix
+
+    def inline_admin_formset(self, request, obj, inline, FormSet, prefix):
+        formset = FormSet(instance=obj or self.model(), prefix=prefix, queryset=inline.queryset(request))
+        return helpers.InlineAdminFormSet(inline, formset,
+            list(inline.get_fieldsets(request, obj)),
+            dict(inline.get_prepopulated_fields(request, obj)),
+            list(inline.get_readonly_fields(request, obj)), model_admin=self)
+
+    def fragmento(self, request, obj, inline_admin_formsets, versiones=None):
+        return TemplateResponse(request, 'admin/anarapp/pestana.html', {
+            'inline_admin_formsets': inline_admin_formsets,
+            'original': obj,
+            'opts': self.model._meta,
+            'versiones': versiones,
+        }, current_app=self.admin_site.name)
+
+    def pestana_view(self, request, object_id, pestana):
+        """ Retorna solo los inlines de la pestaña dada, para el objeto object_id o
+        para uno nuevo si object_id es 'add' """
+
+        if object_id == 'add':
+            obj = None
+            if not self.has_add_permission(request):
+                raise PermissionDenied
+        else:
+            obj = self.get_object(request, unquote(object_id))
+            if obj is None:
+                raise Http404
+            if not self.has_change_permission(request, obj):
+                raise PermissionDenied
+
+        # Las versiones se leen antes que los datos: si cambian en medio, el guardado
+        # de la seccion da conflicto en lugar de pisar el cambio
+        versiones = secciones.versiones(obj)
+        inline_admin_formsets = [self.inline_admin_formset(request, obj, inline, FormSet, prefix)
+            for inline, FormSet, prefix in self.formsets_inlines(request, obj)
+            if self.pestana_de(inline) == pestana]
+
+        return self.fragmento(request, obj, inline_admin_formsets, json.dumps(versiones) if obj else None)
+
+    def seccion_view(self, request, object_id, prefijo):
+        """ Valida y guarda solo el inline con el prefijo dado si su version sigue siendo
+        la enviada. Responde en JSON la nueva version y el inline de nuevo en html, los
+        errores del formset (400) o la version actual si otra persona lo cambio (409) """
+
+        if request.method != 'POST':
+            return HttpResponseNotAllowed(['POST'])
+
+        obj = self.get_object(request, unquote(object_id))
+        if obj is None:
+            raise Http404
+        if not self.has_change_permission(request, obj):
+            raise PermissionDenied
+
+        for inline, FormSet, prefix in self.formsets_inlines(request, obj):
+            if prefix == prefijo:
+                break
+        else:
+            raise Http404
+
+        try:
+            esperada = int(request.POST.get('version', ''))
+        except ValueError:
+            return HttpResponseBadRequest()
+
+        with transaction.commit_on_success():
+            try:
+                fila = secciones.bloquear(obj, prefijo, esperada)
+            except secciones.ConflictoVersion as conflicto:
+                return respuesta_json({'version': conflicto.actual}, status=409)
+
+            formset = FormSet(request.POST, request.FILES, instance=obj, prefix=prefijo,
+                queryset=inline.queryset(request))
+            if not formset.is_valid():
+                return respuesta_json({'errores': formset.errors,
+                    'generales': formset.non_form_errors()}, status=400)
+
+            self.save_formset(request, None, formset, change=True)
+            version = secciones.incrementar(fila)
+            self.log_change(request, obj, u'Modificada la sección %s.' % force_unicode(inline.model._meta.verbose_name))
+
+        html = self.fragmento(request, obj, [self.inline_admin_formset(request, obj, inline, FormSet, prefijo)])
+        return respuesta_json({'version': version, 'html': html.rendered_content})
+
+    def versiones_enviadas(self, request):
+        """ Versiones de las secciones que admin.js envia con el formulario completo,
+        o None si no vinieron """
+
+        try:
+            enviadas = json.loads(request.POST.get('versiones', ''))
+            return dict((prefijo, int(version)) for prefijo, version in enviadas.items())
+        except (ValueError, TypeError, AttributeError):
+            return None
+
+    def get_formsets(self, request, obj=None):
+        # Al guardar el formulario completo, cada seccion modificada se valida contra la
+        # version que tenia al abrirse, igual que en seccion_view
+        esperadas = self.versiones_enviadas(request) if request.method == 'POST' else None
+        for FormSet in super(PestanasAdmin, self).get_formsets(request, obj):
+            if obj is not None and esperadas is not None:
+                FormSet = secciones.con_version(FormSet, obj, esperadas)
+            yield FormSet
+
+    def change_view(self, request, object_id, form_url='', extra_context=None):
+        # Versiones de las secciones leidas antes que los datos, para admin.js. Si el
+        # guardado vuelve con errores se conservan las enviadas, asi una seccion en
+        # conflicto sigue en conflicto hasta recargar la pagina
+        versiones = self.versiones_enviadas(request) if request.method == 'POST' else None
+        if versiones is None:
+            versiones = secciones.versiones(self.get_object(request, unquote(object_id)))
+        extra_context = dict(extra_context or {}, versiones=json.dumps(versiones))
+        return super(PestanasAdmin, self).change_view(request, object_id, form_url, extra_context)
+
+    def save_related(self, request, form, formsets, change):
+        # Guardar el formulario completo tambien cambia la version de cada seccion
+        # modificada, para que los guardados parciales abiertos antes den conflicto. La
+        # fila ya quedo bloqueada al validar el formset si se enviaron las versiones
+        super(PestanasAdmin, self).save_related(request, form, formsets, change)
+        for formset in formsets:
+            if formset.has_changed():
+                fila = getattr(formset, 'fila_version', None) or secciones.bloquear(form.instance, formset.prefix)
+                secciones.incrementar(fila)
+
+def respuesta_json(datos, status=200):
+    return HttpResponse(json.dumps(datos, default=force_unicode), content_type='application/json', status=status)
+
+
 ########################################################################################
 # Declaracion y registro de administradores
 ########################################################################################
     
 #Administrador del modelo de datos Yacimiento
 #Usando los parametros de la extensión Suite, se mejora y organiza el admin
-class YacimientoAdmin(admin.ModelAdmin):
+class YacimientoAdmin(PestanasAdmin):
 
     model = Yacimiento
     form = forms.YacimientoForm
     list_display = ('codigo','nombre', 'pais','estado', 'manifestaciones',)
-    list_filter = ('codigo','pais', 'estado',)
+    list_filter = ('pais', 'estado',)
+    search_fields = ('codigo', 'nombre')
+    paginator = PaginadorAproximado
     
     fieldsets = [
         ('Datos generales del Yacimiento', {
@@ -629,6 +837,15 @@ class YacimientoAdmin(admin.ModelAdmin):
         }),                    
     ]
 	
+    def get_changelist(self, request, **kwargs):
+        # El cuadro de busqueda consulta el indice (ver anarapp.listados)
+        return BusquedaChangeList
+
+    def queryset(self, request):
+        # Estado y tipos de manifestacion de toda la pagina en la misma consulta
+        return super(YacimientoAdmin, self).queryset(request) \
+            .select_related('estado', 'ManifestacionYacimiento')
+
     def manifestaciones(self, object):
         return object.tipos_de_manifestaciones    
     manifestaciones.short_description = "13. Tipo de Manifestacion"
@@ -670,11 +887,13 @@ class YacimientoAdmin(admin.ModelAdmin):
 #Administrador del modelo de datos Piedra
 #Usando los parametros de la extensión Suite, se mejora y organiza el admin
 
-class PiedraAdmin (admin.ModelAdmin):
+class PiedraAdmin (PestanasAdmin):
     model = Piedra
     form = forms.PiedraForm
     list_display = ('yacimiento', 'codigo', 'nombre', 'manifiestacionAsociada', 'estado')	 
-    list_filter = ('yacimiento', 'codigo', 'estado')
+    list_filter = ('estado',)
+    search_fields = ('codigo', 'nombre')
+    paginator = PaginadorAproximado
 
     fieldsets = [
         ('Datos generales de la Roca', {
@@ -687,6 +906,11 @@ class PiedraAdmin (admin.ModelAdmin):
             'fields': ['manifiestacionAsociada',]
         }),
      ]
+
+    def get_changelist(self, request, **kwargs):
+        # El cuadro de busqueda consulta el indice (ver anarapp.listados)
+        return BusquedaChangeList
+
     inlines = [
         FotografiaPiedraInline, CaraTrabajadaInline, DimensionPiedraInline, UbicacionCarasInline, FigurasPorTipoInline,
         EsquemaPorCaraInline, ManifestacionesInline, TratFotoInline, FotoDigPiedraInline,
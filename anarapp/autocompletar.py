@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+########################################################################################
+# Autocompletado de nombres
+# Arreglo ordenado en memoria con los nombres y codigos de yacimientos, los codigos de
+# piedras y los nombres de sus figuras. Las sugerencias para un prefijo se buscan con
+# bisect, sin pasar por el indice de busqueda ni por la base de datos.
+########################################################################################
+
+import bisect
+import re
+
+from anarapp.models import Yacimiento, Piedra
+from anarapp.texto import clave
+from anarapp.versiones import version_datos, nueva_version, CLAVE_NOMBRES
+
+# Cantidad de sugerencias por defecto y maxima
+SUGERENCIAS = 10
+MAXIMO_SUGERENCIAS = 50
+
+# Inicio de cada palabra, para sugerir 'Piedra del Indio' al escribir 'ind'
+PALABRA = re.compile(r'\w+', re.UNICODE)
+
+def entradas(tipo, codigo, texto):
+	""" Retorna las entradas (clave, texto, tipo, codigo) del texto: una por cada
+	palabra, con la clave desde esa palabra hasta el final """
+
+	if not texto:
+		return []
+
+	normalizado = clave(texto)
+	return [(normalizado[palabra.start():], texto, tipo, codigo) for palabra in PALABRA.finditer(normalizado)]
+
+def entradas_yacimiento(pk, codigo, nombre):
+	return entradas('yacimiento', codigo, nombre) + entradas('yacimiento', codigo, codigo)
+
+def entradas_piedra(pk, codigo, figuras):
+	return entradas('piedra', codigo, codigo) + entradas('figura', codigo, figuras)
+
+class Autocompletado(object):
+
+	""" Lista ordenada de entradas y, por cada objeto, las entradas que le pertenecen
+	para poder quitarlas cuando cambia """
+
+	def __init__(self):
+		self.entradas = []
+		self.objetos = {}
+		self.version = None
+
+	def construir(self, yacimientos, piedras):
+		""" Reemplaza el contenido por las filas (pk, codigo, nombre) de yacimientos y
+		(pk, codigo, nombreFiguras) de piedras """
+
+		self.objetos = {}
+		for fila in yacimientos:
+			self.objetos[('yacimiento', fila[0])] = entradas_yacimiento(*fila)
+		for fila in piedras:
+			self.objetos[('piedra', fila[0])] = entradas_piedra(*fila)
+
+		self.entradas = sorted(entrada for lista in self.objetos.values() for entrada in lista)
+
+	def quitar(self, objeto):
+		for entrada in self.objetos.pop(objeto, ()):
+			posicion = bisect.bisect_left(self.entradas, entrada)
+			if posicion < len(self.entradas) and self.entradas[posicion] == entrada:
+				del self.entradas[posicion]
+
+	def agregar(self, objeto, lista):
+		self.quitar(objeto)
+		self.objetos[objeto] = lista
+		for entrada in lista:
+			bisect.insort(self.entradas, entrada)
+
+	def buscar(self, prefijo, cantidad=SUGERENCIAS, tipos=None):
+		""" Retorna hasta cantidad sugerencias (texto, tipo, codigo) cuyo texto tiene una
+		palabra que empieza con el prefijo, sin repetir textos. Con tipos solo se sugieren
+		entradas de esos tipos """
+
+		prefijo = clave(prefijo).strip()
+		if not prefijo:
+			return []
+
+		sugerencias = []
+		vistos = set()
+		posicion = bisect.bisect_left(self.entradas, (prefijo,))
+		while posicion < len(self.entradas) and len(sugerencias) < cantidad:
+			normalizado, texto, tipo, codigo = self.entradas[posicion]
+			if not normalizado.startswith(prefijo):
+				break
+			if texto not in vistos and (not tipos or tipo in tipos):
+				vistos.add(texto)
+				sugerencias.append((texto, tipo, codigo))
+			posicion += 1
+
+		return sugerencias
+
+_autocompletado = Autocompletado()
+
+def autocompletado():
+	""" Retorna el autocompletado del proceso, construyendolo la primera vez y cada
+	vez que otro proceso modifico nombres o codigos """
+
+	version = version_datos(CLAVE_NOMBRES)
+	if _autocompletado.version != version:
+		_autocompletado.construir(Yacimiento.objects.values_list('pk', 'codigo', 'nombre'),
+			Piedra.objects.values_list('pk', 'codigo', 'nombreFiguras'))
+		_autocompletado.version = version
+	return _autocompletado
+
+def actualizar(instancia, borrada=False):
+	""" Actualiza solo las entradas del yacimiento o piedra dado luego de guardarlo o
+	borrarlo. Los demas procesos reconstruyen al ver la nueva version """
+
+	vigente = _autocompletado.version == version_datos(CLAVE_NOMBRES)
+	version = nueva_version(CLAVE_NOMBRES)
+	if not vigente:
+		return
+
+	if isinstance(instancia, Yacimiento):
+		objeto = ('yacimiento', instancia.pk)
+		lista = entradas_yacimiento(instancia.pk, instancia.codigo, instancia.nombre)
+	else:
+		objeto = ('piedra', instancia.pk)
+		lista = entradas_piedra(instancia.pk, instancia.codigo, instancia.nombreFiguras)
+
+	if borrada:
+		_autocompletado.quitar(objeto)
+	else:
+		_autocompletado.agregar(objeto, lista)
+	_autocompletado.version = version
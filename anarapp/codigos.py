@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+########################################################################################
+# Tablas de codigos
+# Traducen los campos booleanos de la ficha de yacimiento a los codigos enteros
+# que utilizan el indice de busqueda, los formularios y los cruces.
+# Cada entrada es (codigo, modelo, campos): el codigo esta presente si todos los
+# campos del modelo son verdaderos.
+########################################################################################
+
+TIPO = (
+	(1, 'TipoYacimiento', ('esParedRocosa',)),
+	(2, 'TipoYacimiento', ('esRoca',)),
+	(3, 'TipoYacimiento', ('esDolmen',)),
+	(4, 'TipoYacimiento', ('esAbrigo',)),
+	(5, 'TipoYacimiento', ('esCueva',)),
+	(6, 'TipoYacimiento', ('esCuevadeRec',)),
+	(7, 'TipoYacimiento', ('esTerrenoSup',)),
+	(8, 'TipoYacimiento', ('esTerrenoPro',)),
+)
+
+EXPOSICION = (
+	(1, 'TipoExposicionYac', ('expuesto',)),
+	(2, 'TipoExposicionYac', ('noExpuesto',)),
+	(3, 'TipoExposicionYac', ('expuestoPeriodicamente',)),
+)
+
+MANIFESTACION = (
+	(1, 'ManifestacionYacimiento', ('esGeoglifo',)),
+	(2, 'ManifestacionYacimiento', ('esPintura',)),
+	(3, 'ManifestacionYacimiento', ('esPetroglifo',)),
+	(4, 'ManifestacionYacimiento', ('esPetroglifoPintado',)),
+	(5, 'ManifestacionYacimiento', ('esMicroPetroglifo',)),
+	(6, 'ManifestacionYacimiento', ('esPiedraMiticaNatural',)),
+	(7, 'ManifestacionYacimiento', ('esCerroMiticoNatural',)),
+	(8, 'ManifestacionYacimiento', ('esCerroConPetroglifo',)),
+	(9, 'ManifestacionYacimiento', ('esCerroConPintura',)),
+	(10, 'ManifestacionYacimiento', ('esCerroConDolmen',)),
+	(11, 'ManifestacionYacimiento', ('esMonumentosMegaliticos',)),
+	(12, 'ManifestacionYacimiento', ('esMonolitos',)),
+	(13, 'ManifestacionYacimiento', ('esMonolitoConGrabados',)),
+	(14, 'ManifestacionYacimiento', ('esMenhires',)),
+	(15, 'ManifestacionYacimiento', ('esMenhiresConPuntos',)),
+	(16, 'ManifestacionYacimiento', ('esMenhiresConPetroglifo',)),
+	(17, 'ManifestacionYacimiento', ('esMenhiresConPintura',)),
+	(18, 'ManifestacionYacimiento', ('esAmolador',)),
+	(19, 'ManifestacionYacimiento', ('esBatea',)),
+	(20, 'ManifestacionYacimiento', ('esPuntosAcoplados',)),
+	(21, 'ManifestacionYacimiento', ('esCupulas',)),
+	(22, 'ManifestacionYacimiento', ('esMortero',)),
+)
+
+UBICACION = (
+	(1, 'UbicacionYacimiento', ('enCerro',)),
+	(2, 'UbicacionYacimiento', ('enCerroCima',)),
+	(3, 'UbicacionYacimiento', ('enCerroLadera',)),
+	(4, 'UbicacionYacimiento', ('enCerroFalda',)),
+	(5, 'UbicacionYacimiento', ('enCerroFila',)),
+	(6, 'UbicacionYacimiento', ('enCerroPieDeMonte',)),
+	(7, 'UbicacionYacimiento', ('enCerroBarranco',)),
+	(8, 'UbicacionYacimiento', ('enCerroAcantilado',)),
+	(9, 'UbicacionYacimiento', ('enValle',)),
+	(10, 'UbicacionYacimiento', ('enRio',)),
+	(11, 'UbicacionYacimiento', ('enRioLecho',)),
+	(12, 'UbicacionYacimiento', ('enRioMargenDerecha',)),
+	(13, 'UbicacionYacimiento', ('enRioMargenIzquierda',)),
+	(14, 'UbicacionYacimiento', ('enRioIsla',)),
+	(15, 'UbicacionYacimiento', ('enRioRaudal',)),
+	(16, 'UbicacionYacimiento', ('enRioCosta',)),
+)
+
+MATERIAL = (
+	(1, 'MaterialYacimiento', ('esRoca', 'esIgnea')),
+	(2, 'MaterialYacimiento', ('esRoca', 'esMetamor')),
+	(3, 'MaterialYacimiento', ('esRoca', 'esSedimentaria')),
+	(4, 'MaterialYacimiento', ('esTierra',)),
+	(5, 'MaterialYacimiento', ('esHueso',)),
+	(6, 'MaterialYacimiento', ('esCorteza',)),
+	(7, 'MaterialYacimiento', ('esPiel',)),
+)
+
+# Nombre de cada codigo de material, para los formularios y las facetas
+NOMBRES_MATERIAL = {
+	1: 'Roca Ígnea',
+	2: 'Roca Metamórfica',
+	3: 'Roca Sedimentaria',
+	4: 'Tierra',
+	5: 'Hueso',
+	6: 'Corteza de árbol',
+	7: 'Pieles',
+}
+
+CONSERVACION = (
+	(1, 'EstadoConserYac', ('enBuenEstado',)),
+	(2, 'EstadoConserYac', ('estadoModificado',)),
+	(3, 'CausasDestruccionYac', ('porErosion', 'porErosionParModerada')),
+	(4, 'CausasDestruccionYac', ('porErosion', 'porErosionParSevera')),
+	(5, 'CausasDestruccionYac', ('porErosion', 'porErosionExtModerada')),
+	(6, 'CausasDestruccionYac', ('porErosion', 'porErosionExtSevera')),
+)
+
+MANIF_ASOCIADAS = (
+	(1, 'ManifestacionesAsociadas', ('esLitica',)),
+	(2, 'ManifestacionesAsociadas', ('esCeramica',)),
+	(3, 'ManifestacionesAsociadas', ('esOseo',)),
+	(4, 'ManifestacionesAsociadas', ('esConcha',)),
+	(5, 'ManifestacionesAsociadas', ('esCarbon',)),
+	(6, 'ManifestacionesAsociadas', ('esMito',)),
+	(7, 'ManifestacionesAsociadas', ('esCementerio',)),
+	(8, 'ManifestacionesAsociadas', ('esMonticulo',)),
+)
+
+SURCO_PETROGLIFO = (
+	(1, 'CaracSurcoPetroglifo', ('esBase',)),
+	(2, 'CaracSurcoPetroglifo', ('esBaseRedonda',)),
+	(3, 'CaracSurcoPetroglifo', ('esBaseAguda',)),
+	(4, 'CaracSurcoPetroglifo', ('esBajoRelieve',)),
+	(5, 'CaracSurcoPetroglifo', ('esBajoRelieveLineal',)),
+	(6, 'CaracSurcoPetroglifo', ('esBajoRelievePlanar',)),
+	(7, 'CaracSurcoPetroglifo', ('esAltoRelieve',)),
+	(8, 'CaracSurcoPetroglifo', ('esAltoRelieveLineal',)),
+	(9, 'CaracSurcoPetroglifo', ('esAltoRelievePlanar',)),
+	(10, 'CaracSurcoPetroglifo', ('esAreaInterlineal',)),
+	(11, 'CaracSurcoPetroglifo', ('esAreaInterlinealPulida',)),
+	(12, 'CaracSurcoPetroglifo', ('esAreaInterlinealRebajada',)),
+	(13, 'CaracSurcoPetroglifo', ('esGrabadoSuperpuesto',)),
+	(14, 'CaracSurcoPetroglifo', ('esGrabadoRebajado',)),
+)
+
+CRONOLOGIA = (
+	(1, 'CronologiaTentativa', ('esCrono1',)),
+	(2, 'CronologiaTentativa', ('esCrono2',)),
+	(3, 'CronologiaTentativa', ('esCrono3',)),
+	(4, 'CronologiaTentativa', ('esCrono4',)),
+	(5, 'CronologiaTentativa', ('esCrono5',)),
+	(6, 'CronologiaTentativa', ('esCrono6',)),
+	(7, 'CronologiaTentativa', ('esCrono7',)),
+)
+
+# Nombre del campo del indice -> tabla de codigos
+GRUPOS = {
+	'tipo': TIPO,
+	'exposicion': EXPOSICION,
+	'manifestacion': MANIFESTACION,
+	'ubicacion': UBICACION,
+	'material': MATERIAL,
+	'conservacion': CONSERVACION,
+	'manifasociadas': MANIF_ASOCIADAS,
+	'carasurcopetrotipo': SURCO_PETROGLIFO,
+}
+
+# Grupos que solo se guardan en el resumen del yacimiento, no en el indice
+GRUPOS_RESUMEN = dict(GRUPOS, cronologia=CRONOLOGIA)
+
+def codigos(ficha, grupo):
+	""" Retorna los codigos del grupo presentes en la ficha dada. La ficha es un
+	diccionario nombre de modelo -> instancia (o None si el yacimiento no la tiene),
+	o lista de instancias si el yacimiento puede tener varias filas del modelo """
+
+	lista = []
+	for codigo, modelo, campos in GRUPOS_RESUMEN[grupo]:
+		instancias = ficha.get(modelo)
+		if not isinstance(instancias, list):
+			instancias = [] if instancias is None else [instancias]
+		if any(all(getattr(instancia, c) for c in campos) for instancia in instancias):
+			lista.append(codigo)
+	return lista
+
+def opciones(tabla, nombres):
+	""" Retorna las opciones (codigo, nombre) de un campo de seleccion con los codigos
+	de la tabla dada """
+
+	return tuple((codigo, nombres[codigo]) for codigo, modelo, campos in tabla)
+
+def modelos(grupos=None):
+	""" Retorna los nombres de los modelos que intervienen en los grupos dados """
+
+	nombres = set()
+	for grupo in (grupos or GRUPOS_RESUMEN.keys()):
+		for codigo, modelo, campos in GRUPOS_RESUMEN[grupo]:
+			nombres.add(modelo)
+	return nombres
+
+########################################################################################
+# Mascaras de bits
+# Cada grupo se guarda tambien como un entero donde el codigo c ocupa el bit c - 1,
+# para filtrar con una sola comparacion en lugar de un OR sobre varias columnas.
+########################################################################################
+
+def mascara(lista):
+	""" Retorna la mascara de bits de una lista de codigos """
+
+	valor = 0
+	for codigo in lista:
+		valor |= 1 << (int(codigo) - 1)
+	return valor
+
+def desde_mascara(valor):
+	""" Retorna la lista ordenada de codigos presentes en la mascara dada """
+
+	lista = []
+	codigo = 1
+	while valor:
+		if valor & 1:
+			lista.append(codigo)
+		valor >>= 1
+		codigo += 1
+	return lista
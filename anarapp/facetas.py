@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+########################################################################################
+# Facetas de los resultados de busqueda
+# Whoosh no calcula facetas, asi que se cuentan sobre ResumenYacimiento: se piden al
+# indice solo los ids de los yacimientos encontrados y una consulta agrupada por estado
+# y mascaras de codigos reparte los totales por valor. Las facetas de una busqueda se
+# calculan una sola vez y se guardan en la cache para todas sus paginas.
+########################################################################################
+
+import hashlib
+
+from django.core.cache import cache
+from django.db.models import Count
+from django.utils.encoding import force_unicode
+
+from anarapp import codigos
+from anarapp.codigos import desde_mascara
+from anarapp.forms import OPCIONES_ESTADO, OPCIONES_TIPO, OPCIONES_MANIFESTACION, \
+	OPCIONES_CONSERVACION
+from anarapp.models import Yacimiento, ResumenYacimiento
+from anarapp.texto import clave
+from anarapp.versiones import version_datos
+
+# Campo del formulario, titulo y opciones (valor, etiqueta) de cada faceta
+FACETAS = (
+	('estado', 'Estado', OPCIONES_ESTADO),
+	('tipo', 'Tipo de yacimiento', OPCIONES_TIPO),
+	('manifestacion', 'Manifestacion', OPCIONES_MANIFESTACION),
+	('material', 'Material', codigos.opciones(codigos.MATERIAL, codigos.NOMBRES_MATERIAL)),
+	('conservacion', 'Conservacion', OPCIONES_CONSERVACION),
+)
+
+GRUPOS = [campo for campo, titulo, opciones in FACETAS if campo != 'estado']
+
+def yacimientos_encontrados(sqs, total):
+	""" Retorna los ids de los yacimientos del resultado con una sola consulta al
+	indice, sin cargar los objetos """
+
+	if not total:
+		return []
+	return [int(pk) for pk in sqs.models(Yacimiento).values_list('pk', flat=True)[:total]]
+
+def contar(ids):
+	""" Retorna, por faceta, el diccionario valor -> cantidad de yacimientos. El estado
+	se cuenta por su nombre normalizado y los demas por codigo """
+
+	conteos = dict((campo, {}) for campo, titulo, opciones in FACETAS)
+	if not ids:
+		return conteos
+
+	columnas = ['estado'] + ['mascara_' + grupo for grupo in GRUPOS]
+	filas = ResumenYacimiento.objects.filter(yacimiento__in=ids).order_by() \
+		.values(*columnas).annotate(total=Count('id'))
+
+	for fila in filas:
+		estado = clave(fila['estado']).strip()
+		conteos['estado'][estado] = conteos['estado'].get(estado, 0) + fila['total']
+		for grupo in GRUPOS:
+			for codigo in desde_mascara(fila['mascara_' + grupo]):
+				conteos[grupo][codigo] = conteos[grupo].get(codigo, 0) + fila['total']
+
+	return conteos
+
+def sin_paginacion(parametros):
+	""" Retorna una copia de los parametros GET sin los de paginacion, para volver a
+	la primera pagina al cambiar la busqueda """
+
+	consulta = parametros.copy()
+	for parametro in ('page', 'despues', 'antes'):
+		consulta.pop(parametro, None)
+	return consulta
+
+def clave_facetas(parametros):
+	""" Clave de cache de las facetas: version de los datos y parametros de la busqueda
+	sin los de paginacion, asi todas las paginas de una busqueda comparten la clave """
+
+	consulta = sin_paginacion(parametros)
+	valores = sorted((campo, sorted(consulta.getlist(campo))) for campo in consulta)
+	resumen = hashlib.md5(repr(valores)).hexdigest()
+	return 'facetas:%s:%s' % (version_datos(), resumen)
+
+def facetas(sqs, total, parametros):
+	""" Retorna la lista de facetas para la plantilla: (titulo, [(etiqueta, cantidad,
+	enlace)]) con los valores que tienen resultados. El enlace agrega el valor a los
+	parametros GET de la busqueda actual. Solo la primera pagina que se pide de una
+	busqueda consulta el indice y la base de datos """
+
+	clave_cache = clave_facetas(parametros)
+	resultado = cache.get(clave_cache)
+	if resultado is None:
+		resultado = calcular(sqs, total, parametros)
+		cache.set(clave_cache, resultado)
+	return resultado
+
+def calcular(sqs, total, parametros):
+	conteos = contar(yacimientos_encontrados(sqs, total))
+
+	resultado = []
+	for campo, titulo, opciones in FACETAS:
+		elegidos = parametros.getlist(campo)
+		valores = []
+		for valor, etiqueta in opciones:
+			llave = clave(valor).strip() if campo == 'estado' else valor
+			cantidad = conteos[campo].get(llave, 0)
+			if not cantidad:
+				continue
+
+			enlace = None
+			if force_unicode(valor) not in elegidos:
+				consulta = sin_paginacion(parametros)
+				consulta.appendlist(campo, valor)
+				enlace = '?' + consulta.urlencode()
+			valores.append((etiqueta, cantidad, enlace))
+
+		if valores:
+			resultado.append((titulo, valores))
+
+	return resultado
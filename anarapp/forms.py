@@ -1,34 +1,69 @@
 # -*- coding: utf-8 -*-
 
+import logging
+
 from django import forms
+from django.conf import settings
+from django.core.urlresolvers import reverse
 from haystack.forms import SearchForm
 import anarapp.models
 import dynamic
+from geoespacial.indice import alrededor, RADIO_MAXIMO
+from anarapp.texto import clave_exacta
+from anarapp import codigos
 
 from django.forms import ModelForm
 from suit.widgets import LinkedSelect, AutosizedTextarea, TextInput, Select
 
+logger = logging.getLogger('anarapp.busqueda')
 
 
 class BaseForm(SearchForm):
-    # Busqueda
-    def search(self):
-        sqs = super(BaseForm, self).search()
-        print sqs
+    # Campos que no son del indice de busqueda; q ya la aplica SearchForm como texto
+    # libre y los demas los filtra cada formulario en filtrar()
+    campos_aparte = ('q',)
 
+    # Campos que se filtran por igualdad sobre su campo clave normalizado del indice
+    # (estado -> estado_clave), asi 'Bolívar' encuentra tambien 'BOLIVAR'
+    campos_clave = ('estado',)
 
-        if not self.is_valid():
-        	return self.no_query_found()
+    def filtros(self):
+        """ Filtros del indice para los campos llenos del formulario """
 
         filters = {}
         for field, value in self.cleaned_data.items():
-            if self.cleaned_data[field]:
-                if isinstance(value, list):
-                    filters[field + '__in'] = value	
+            if value and field not in self.campos_aparte:
+                if field in self.campos_clave:
+                    valores = value if isinstance(value, list) else [value]
+                    filters[field + '_clave__in'] = [clave_exacta(valor) for valor in valores]
+                elif isinstance(value, list):
+                    filters[field + '__in'] = value
                 else:
                     filters[field] = value
+        return filters
+
+    def filtrar(self, sqs):
+        """ Filtros adicionales de cada formulario. No debe evaluar el SearchQuerySet """
 
-        return sqs.filter(**filters)
+        return sqs
+
+    # Busqueda
+    def search(self):
+        """ Arma la consulta completa sin ejecutarla; el indice se consulta una sola vez
+        cuando la vista pagina los resultados """
+
+        sqs = super(BaseForm, self).search()
+
+        if not self.is_valid():
+            return self.no_query_found()
+
+        sqs = self.filtrar(sqs.filter(**self.filtros()))
+
+        if settings.DEBUG:
+            # str(sqs.query) solo arma el texto de la consulta, no la ejecuta
+            logger.debug(u'Consulta de busqueda: %s', sqs.query)
+
+        return sqs
 
 
 def crear_form(classes, name):
@@ -141,18 +176,12 @@ OPCIONES_EXPOSICION = (
 
 OPCIONES_UBICACION = (
     (1, 'Cerro'),
-    (2, 'Valle'),
-    (3, 'Río'),
-    (4, 'Costa'),
+    (9, 'Valle'),
+    (10, 'Río'),
+    (16, 'Costa'),
 )
 
-OPCIONES_MATERIAL = (
-         (1, 'Roca'),
-    (2, 'Tierra'),
-    (3, 'Hueso'),
-    (4, 'Corteza de árbol'),
-    (5, 'Pieles'),
-)
+OPCIONES_MATERIAL = codigos.opciones(codigos.MATERIAL, codigos.NOMBRES_MATERIAL)
 
 OPCIONES_CONSERVACION = (
         (1, 'Bueno'),
@@ -199,6 +228,22 @@ class AdvancedForm(BasicForm):
         conservacion.widget.attrs         = {'class':'chzn-select', 'data-placeholder':'Seleccione el estado de conservación'}
         manifasociadas.widget.attrs = {'class':'chzn-select', 'data-placeholder':'Seleccione las manifetaciones asociadas'}
 
+        #Busqueda por cercania a otro yacimiento
+        cercaDe                       = forms.CharField(required=False, max_length=20, label='Cerca del yacimiento')
+        radio                           = forms.FloatField(required=False, min_value=0, max_value=RADIO_MAXIMO, label='Radio en km')
+
+        campos_aparte = BasicForm.campos_aparte + ('cercaDe', 'radio')
+
+        def filtrar(self, sqs):
+                sqs = super(AdvancedForm, self).filtrar(sqs)
+
+                codigo = self.cleaned_data.get('cercaDe')
+                radio = self.cleaned_data.get('radio')
+                if codigo and radio:
+                        codigos = [sitio.codigo for d, sitio in alrededor(codigo, radio)]
+                        sqs = sqs.filter(codigo__in=codigos) if codigos else sqs.none()
+
+                return sqs
 
 
 class PiedraForm(BaseForm):
@@ -700,6 +745,25 @@ class YacimientoForm(ModelForm) :
 		'pais': TextInput(attrs=regularTextField),
         }
 
+    def __init__(self, *args, **kwargs):
+        super(YacimientoForm, self).__init__(*args, **kwargs)
+
+        # Los municipios del estado se eligen en el navegador con la tabla de
+        # /municipios.json (ver anarapp.municipios y admin.js), sin consultar /chaining/
+        campo = self.fields['municipio']
+        select = forms.Select(attrs={'data-municipios': reverse('municipios'), 'data-estado': self.add_prefix('estado')})
+        if hasattr(campo.widget, 'widget'):
+            campo.widget.widget = select
+        else:
+            campo.widget = select
+
+        # Se ofrecen y aceptan solo los municipios del estado elegido
+        estado = self.data.get(self.add_prefix('estado')) if self.is_bound else self.instance.estado_id
+        try:
+            campo.queryset = campo.queryset.filter(estado=int(estado))
+        except (TypeError, ValueError):
+            campo.queryset = campo.queryset.none()
+
 class LocalidadYacimientoForm(ModelForm) :
     class Meta:
         widgets = {
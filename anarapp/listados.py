@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+########################################################################################
+# Busqueda en los listados del admin
+# El cuadro de busqueda de los listados de yacimientos y piedras consulta el indice de
+# busqueda (Whoosh o PostgreSQL, ver HAYSTACK_CONNECTIONS) en lugar de recorrer la tabla
+# con icontains. Los cambios hechos desde el admin aparecen al procesar la cola del
+# indice (procesar_cola_indice).
+########################################################################################
+
+from django.contrib import messages
+from django.contrib.admin.views.main import ChangeList
+from haystack.query import SearchQuerySet
+
+from anarapp.models import Estado
+from anarapp.texto import clave_exacta
+
+# Cantidad maxima de objetos encontrados que se muestran en el listado
+MAXIMO_ENCONTRADOS = 1000
+
+def filtros_indice(parametros):
+	""" Traduce los filtros del listado que tienen campo en el indice (estado y pais)
+	a filtros de haystack, para que se apliquen antes de cortar los resultados """
+
+	filtros = {}
+	for parametro, valor in parametros.items():
+		if parametro == 'estado__id__exact' and valor.isdigit():
+			nombres = Estado.objects.filter(pk=valor).values_list('nombre', flat=True)
+			filtros['estado_clave'] = clave_exacta(nombres[0]) if nombres else u''
+		elif parametro == 'pais':
+			filtros['pais__exact'] = valor
+	return filtros
+
+def encontrados(modelo, texto, filtros=None, cantidad=MAXIMO_ENCONTRADOS):
+	""" Retorna los ids de los objetos del modelo que coinciden con el texto y los
+	filtros, con una sola consulta al indice y sin cargar los objetos, y el total de
+	coincidencias """
+
+	sqs = SearchQuerySet().models(modelo).auto_query(texto)
+	if filtros:
+		sqs = sqs.filter(**filtros)
+	pks = sqs.values_list('pk', flat=True)
+	ids = [int(pk) for pk in pks[:cantidad]]
+	# El total ya lo conto el indice al traer la pagina
+	return ids, len(pks)
+
+class BusquedaChangeList(ChangeList):
+
+	""" Listado que aplica los filtros y el orden del admin pero resuelve el texto del
+	cuadro de busqueda con el indice. Si hay mas de MAXIMO_ENCONTRADOS coincidencias
+	se muestran las primeras y se avisa """
+
+	def get_query_set(self, request):
+		texto, self.query = self.query, ''
+		try:
+			qs = super(BusquedaChangeList, self).get_query_set(request)
+		finally:
+			self.query = texto
+
+		if texto:
+			ids, total = encontrados(self.model, texto, filtros_indice(self.params))
+			if total > len(ids):
+				messages.warning(request, u'La búsqueda encontró %d resultados y solo se muestran '
+					u'los primeros %d. Agregue palabras o filtros para acotarla.' % (total, len(ids)))
+			qs = qs.filter(pk__in=ids)
+		return qs
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+from django.db import transaction, reset_queries
+
+from anarapp.models import Coordenadas, Altitud, CaracSurcoPetroglifo
+
+# Modelos con campos numericos calculados a partir de campos de texto
+MODELOS = (Coordenadas, Altitud, CaracSurcoPetroglifo)
+
+def campos_numericos(model):
+	""" Retorna los nombres de los campos calculados (no editables) del modelo """
+
+	return [f.attname for f in model._meta.fields if not f.editable and f.name != 'id']
+
+class Command(BaseCommand):
+	help = "Calcula los campos numericos de coordenadas, altitud y surcos de petroglifos"
+
+	option_list = BaseCommand.option_list + (
+		make_option('-b', '--batch-size', action='store', dest='batchsize', type='int', default=1000,
+			help='Cantidad de filas actualizadas por transaccion.'),
+	)
+
+	def handle(self, **options):
+		verbosity = int(options.get('verbosity', 1))
+		lote = options['batchsize']
+
+		for model in MODELOS:
+			campos = campos_numericos(model)
+			qs = model.objects.order_by('pk')
+			total = qs.count()
+
+			for inicio in range(0, total, lote):
+				with transaction.commit_on_success():
+					# Se actualiza con update() para no disparar las señales de guardado
+					for obj in qs[inicio:inicio + lote]:
+						obj.actualizar_numeros()
+						model.objects.filter(pk=obj.pk).update(**dict((c, getattr(obj, c)) for c in campos))
+				reset_queries()
+
+			if verbosity >= 1:
+				print "%s: %d filas actualizadas." % (model._meta.verbose_name_plural, total)
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+from django.db import transaction, reset_queries
+
+from anarapp.models import Coordenadas
+from anarapp.versiones import nueva_version, CLAVE_COORDENADAS
+from geoespacial.datum import normalizar_coordenadas
+
+class Command(BaseCommand):
+	help = "Lleva a WGS 84 las coordenadas de todos los yacimientos segun su Datum"
+
+	option_list = BaseCommand.option_list + (
+		make_option('-b', '--batch-size', action='store', dest='batchsize', type='int', default=1000,
+			help='Cantidad de coordenadas convertidas por lote.'),
+	)
+
+	def handle(self, **options):
+		verbosity = int(options.get('verbosity', 1))
+		lote = options['batchsize']
+
+		qs = Coordenadas.objects.order_by('pk')
+		total = qs.count()
+
+		for inicio in range(0, total, lote):
+			with transaction.commit_on_success():
+				normalizar_coordenadas(qs[inicio:inicio + lote])
+			reset_queries()
+
+		# Los indices espaciales de los procesos en marcha se reconstruyen
+		nueva_version(CLAVE_COORDENADAS)
+
+		if verbosity >= 1:
+			print "%d coordenadas convertidas a WGS 84." % total
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+from optparse import make_option
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import reset_queries
+
+from haystack import connections as haystack_connections
+from anarapp.models import Yacimiento, Piedra, ColaIndice
+from anarapp.versiones import nueva_version
+
+MODELOS = {
+	'yacimiento': Yacimiento,
+	'piedra': Piedra,
+}
+
+def procesar_cola(using='default', limite=1000):
+	""" Reindexa los objetos pendientes en la cola, agrupando los repetidos.
+	Retorna la cantidad de objetos distintos procesados """
+
+	pendientes = list(ColaIndice.objects.order_by('id')[:limite])
+	if not pendientes:
+		return 0
+
+	backend = haystack_connections[using].get_backend()
+	unified_index = haystack_connections[using].get_unified_index()
+
+	sucios = {}
+	for pendiente in pendientes:
+		sucios.setdefault(pendiente.modelo, set()).add(pendiente.objeto)
+
+	for nombre, ids in sucios.items():
+		model = MODELOS[nombre]
+		index = unified_index.get_index(model)
+
+		# Los que siguen existiendo se reindexan en lote, los demas se borran
+		qs = index.build_queryset(using=using).filter(pk__in=ids)
+		backend.update(index, qs)
+
+		for borrado in ids - set(obj.pk for obj in qs):
+			backend.remove('%s.%s.%s' % (model._meta.app_label, model._meta.module_name, borrado))
+
+	# Solo las filas leidas: una fila con id menor cuya transaccion termino despues de
+	# la lectura todavia no se reindexo
+	ColaIndice.objects.filter(id__in=[pendiente.id for pendiente in pendientes]).delete()
+	# Los reportes que leen del indice deben recalcularse con los datos nuevos
+	nueva_version()
+	reset_queries()
+
+	return sum(len(ids) for ids in sucios.values())
+
+class Command(BaseCommand):
+	help = "Reindexa los yacimientos y piedras modificados desde el admin"
+
+	option_list = BaseCommand.option_list + (
+		make_option('-u', '--using', action='store', dest='using', default='default',
+			help='Conexion de haystack a actualizar.'),
+		make_option('-l', '--limite', action='store', dest='limite', type='int', default=1000,
+			help='Cantidad maxima de entradas de la cola procesadas por ronda.'),
+		make_option('-c', '--continuo', action='store_true', dest='continuo', default=False,
+			help='Seguir vaciando la cola indefinidamente.'),
+		make_option('-i', '--intervalo', action='store', dest='intervalo', type='float', default=5,
+			help='Segundos de espera entre rondas en modo continuo.'),
+	)
+
+	def handle(self, **options):
+		verbosity = int(options.get('verbosity', 1))
+
+		while True:
+			procesados = procesar_cola(options['using'], options['limite'])
+
+			if procesados and verbosity >= 1:
+				print "%d objetos reindexados." % procesados
+
+			if not options['continuo']:
+				break
+			if procesados < options['limite']:
+				time.sleep(options['intervalo'])
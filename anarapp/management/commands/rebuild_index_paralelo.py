@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+from optparse import make_option
+import multiprocessing
+import os
+import shutil
+import sys
+
+from django import db
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import get_model
+
+from haystack import connections as haystack_connections
+from haystack.backends.whoosh_backend import WhooshSearchBackend
+from whoosh.index import open_dir
+
+# Carpeta, junto al indice principal, donde cada proceso escribe su segmento
+CARPETA_PARTES = 'partes'
+
+def _cerrar_conexiones():
+	""" Cada proceso hijo debe abrir su propia conexion a la base de datos """
+
+	for alias in db.connections.databases:
+		try:
+			db.connections[alias].close()
+		except Exception:
+			pass
+
+def _ruta_partes(backend):
+	return os.path.join(os.path.dirname(os.path.normpath(backend.path)), CARPETA_PARTES)
+
+def indexar_rango(tarea):
+	""" Prepara los documentos de un rango de claves primarias y los escribe en el
+	indice propio del proceso. Se ejecuta dentro de los procesos del pool """
+
+	using, app_label, model_name, desde, hasta, verbosity = tarea
+	_cerrar_conexiones()
+
+	principal = haystack_connections[using].get_backend()
+	opciones = dict(settings.HAYSTACK_CONNECTIONS[using])
+	opciones['PATH'] = os.path.join(_ruta_partes(principal), str(os.getpid()))
+	# Misma clase que el backend principal, para que los segmentos tengan su esquema
+	backend = principal.__class__(using, **opciones)
+
+	model = get_model(app_label, model_name)
+	index = haystack_connections[using].get_unified_index().get_index(model)
+	qs = index.build_queryset(using=using).filter(pk__gte=desde, pk__lte=hasta).order_by('pk')
+	backend.update(index, qs)
+
+	if verbosity >= 2:
+		print "  %s: %s - %s indexados (proceso %s)" % (model_name, desde, hasta, os.getpid())
+
+	db.reset_queries()
+	return opciones['PATH']
+
+class Command(BaseCommand):
+	help = "Reconstruye el indice Whoosh repartiendo los rangos de claves primarias entre varios procesos"
+
+	option_list = BaseCommand.option_list + (
+		make_option('-w', '--workers', action='store', dest='workers', type='int',
+			default=multiprocessing.cpu_count(),
+			help='Numero de procesos a utilizar (por defecto, uno por nucleo).'),
+		make_option('-b', '--batch-size', action='store', dest='batchsize', type='int',
+			default=1000,
+			help='Cantidad de objetos por rango de claves primarias.'),
+		make_option('-u', '--using', action='store', dest='using', default='default',
+			help='Conexion de haystack a reconstruir.'),
+		make_option('--noinput', action='store_false', dest='interactive', default=True,
+			help='No pedir confirmacion antes de borrar el indice.'),
+	)
+
+	def handle(self, **options):
+		using = options['using']
+		verbosity = int(options.get('verbosity', 1))
+		backend = haystack_connections[using].get_backend()
+
+		if not isinstance(backend, WhooshSearchBackend):
+			raise CommandError("La conexion '%s' no utiliza el backend de Whoosh" % using)
+
+		if options['interactive']:
+			respuesta = raw_input("Se borrara todo el indice de la conexion '%s'. Desea continuar? [s/N] " % using)
+			if not respuesta.lower().startswith('s'):
+				print "No se realizo ningun cambio."
+				sys.exit()
+
+		partes = _ruta_partes(backend)
+		if os.path.exists(partes):
+			shutil.rmtree(partes)
+
+		# Reparto de los rangos de claves primarias de cada modelo indexado
+		tareas = []
+		unified_index = haystack_connections[using].get_unified_index()
+		for model in unified_index.get_indexed_models():
+			index = unified_index.get_index(model)
+			pks = list(index.build_queryset(using=using).order_by('pk').values_list('pk', flat=True))
+
+			if verbosity >= 1:
+				print u"Indexando %d %s" % (len(pks), model._meta.verbose_name_plural)
+
+			for inicio in range(0, len(pks), options['batchsize']):
+				rango = pks[inicio:inicio + options['batchsize']]
+				tareas.append((using, model._meta.app_label, model._meta.module_name,
+							rango[0], rango[-1], verbosity))
+
+		_cerrar_conexiones()
+		pool = multiprocessing.Pool(options['workers'])
+		try:
+			rutas = set(pool.map(indexar_rango, tareas))
+		finally:
+			pool.terminate()
+
+		# Union de los segmentos en el indice principal
+		backend.clear()
+		backend.setup()
+		writer = backend.index.writer()
+		for ruta in sorted(rutas):
+			reader = open_dir(ruta).reader()
+			for segmento, base in reader.leaf_readers():
+				writer.add_reader(segmento)
+			reader.close()
+		writer.commit()
+
+		shutil.rmtree(partes)
+
+		if verbosity >= 1:
+			print "Indice reconstruido con %d procesos a partir de %d segmentos." % (options['workers'], len(rutas))
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+from django.db import reset_queries
+
+from anarapp.models import Yacimiento
+from anarapp.resumen import resumir, LOTE
+
+class Command(BaseCommand):
+	help = "Reconstruye la tabla de resumenes de yacimientos a partir de las fichas"
+
+	option_list = BaseCommand.option_list + (
+		make_option('-b', '--batch-size', action='store', dest='batchsize', type='int', default=LOTE,
+			help='Cantidad de yacimientos resumidos por lote.'),
+	)
+
+	def handle(self, **options):
+		verbosity = int(options.get('verbosity', 1))
+		lote = options['batchsize']
+
+		qs = Yacimiento.objects.select_related('estado', 'municipio').order_by('pk')
+		total = qs.count()
+
+		for inicio in range(0, total, lote):
+			resumir(list(qs[inicio:inicio + lote]))
+			reset_queries()
+
+			if verbosity >= 2:
+				print "  resumidos %d de %d" % (min(inicio + lote, total), total)
+
+		if verbosity >= 1:
+			print "%d yacimientos resumidos." % total
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 
-from django.db import models
+from django.db import models, connection
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ObjectDoesNotExist
 from smart_selects.db_fields import ChainedForeignKey
+from anarapp.codigos import GRUPOS_RESUMEN, mascara
+from anarapp import numeros
 
 ########################################################################################
 # Clases modificadas
@@ -83,11 +85,12 @@ class Yacimiento(models.Model):
     def _get_tipo_manifestaciones(self):
 	
         "Determina los tipos de manifestaciones presentes en un yacimiento"
+        # Usa la relacion inversa para aprovechar select_related('ManifestacionYacimiento')
         try :
-            manifestacion = ManifestacionYacimiento.objects.get(yacimiento=self.id)
-            return manifestacion.texto_descriptivo
+            manifestacion = self.ManifestacionYacimiento
         except ObjectDoesNotExist:
             return '';
+        return manifestacion.texto_descriptivo if manifestacion is not None else ''
 			
     tipos_de_manifestaciones = property(_get_tipo_manifestaciones)
 	
@@ -241,8 +244,31 @@ class Coordenadas (models.Model):
     latitud = CharField('8. Lat. N', blank = True)
     utmAdicional = CharField('8. Utm Adicional', blank = True)
     
+    # Valores numericos de los campos de texto, se calculan al guardar
+    longitudNum = models.FloatField('Longitud en grados', null = True, editable = False, db_index = True)
+    latitudNum = models.FloatField('Latitud en grados', null = True, editable = False, db_index = True)
+    utmZona = models.IntegerField('Zona UTM', null = True, editable = False)
+    utmBanda = models.CharField('Banda UTM', max_length = 1, blank = True, editable = False)
+    utmEste = models.FloatField('Este UTM', null = True, editable = False, db_index = True)
+    utmNorte = models.FloatField('Norte UTM', null = True, editable = False, db_index = True)
+    
+    # Posicion llevada a WGS 84 segun el Datum del yacimiento, la calcula geoespacial.datum
+    longitudWgs84 = models.FloatField('Longitud WGS 84', null = True, editable = False, db_index = True)
+    latitudWgs84 = models.FloatField('Latitud WGS 84', null = True, editable = False, db_index = True)
+    
     abbr = 'crd'
 
+    def actualizar_numeros(self):
+        "Calcula los campos numericos a partir de los campos de texto"
+        self.longitudNum = numeros.longitud(self.longitud)
+        self.latitudNum = numeros.latitud(self.latitud)
+        self.utmZona, self.utmBanda, self.utmEste, self.utmNorte = \
+            numeros.utm(self.utmAdicional) or (None, '', None, None)
+
+    def save(self, *args, **kwargs):
+        self.actualizar_numeros()
+        super(Coordenadas, self).save(*args, **kwargs)
+
     class Meta:
         verbose_name = '8. Coordenadas'
         verbose_name_plural = '8. Coordenadas'
@@ -278,8 +304,26 @@ class Altitud (models.Model):
     superficie = CharField('10.2. Superficie en m2', blank = True)
     desarrollo = CharField('10.3. Desarrollo', blank = True)
     desnivel = CharField('10.4. Desnivel', blank = True)
+    
+    # Valores numericos de los campos de texto, se calculan al guardar
+    alturaNum = models.FloatField('Altura en mts', null = True, editable = False, db_index = True)
+    superficieNum = models.FloatField('Superficie en m2', null = True, editable = False, db_index = True)
+    desarrolloNum = models.FloatField('Desarrollo', null = True, editable = False)
+    desnivelNum = models.FloatField('Desnivel', null = True, editable = False)
+    
     abbr = 'atd'  
 
+    def actualizar_numeros(self):
+        "Calcula los campos numericos a partir de los campos de texto"
+        self.alturaNum = numeros.numero(self.altura)
+        self.superficieNum = numeros.numero(self.superficie)
+        self.desarrolloNum = numeros.numero(self.desarrollo)
+        self.desnivelNum = numeros.numero(self.desnivel)
+
+    def save(self, *args, **kwargs):
+        self.actualizar_numeros()
+        super(Altitud, self).save(*args, **kwargs)
+
     class Meta:
         verbose_name = '10. Altitud'
         verbose_name_plural = '10. Altitud'
@@ -699,8 +743,25 @@ class CaracSurcoPetroglifo (models.Model):
     esGrabadoSuperpuesto = models.BooleanField('24.7. Grabados Superpuestos')
     esGrabadoRebajado = models.BooleanField('24.8. Grabados Rebajados')
     
+    # Valores numericos de los campos de texto, se calculan al guardar
+    anchoDeNum = models.FloatField('Ancho desde (en cm)', null = True, editable = False, db_index = True)
+    anchoANum = models.FloatField('Ancho hasta (en cm)', null = True, editable = False, db_index = True)
+    profundidadDeNum = models.FloatField('Profundidad desde (en cm)', null = True, editable = False, db_index = True)
+    profundidadANum = models.FloatField('Profundidad hasta (en cm)', null = True, editable = False, db_index = True)
+    
     abbr = 'cpe'
 
+    def actualizar_numeros(self):
+        "Calcula los campos numericos a partir de los campos de texto"
+        self.anchoDeNum = numeros.numero(self.anchoDe)
+        self.anchoANum = numeros.numero(self.anchoA)
+        self.profundidadDeNum = numeros.numero(self.produndidadDe)
+        self.profundidadANum = numeros.numero(self.profundidadA)
+
+    def save(self, *args, **kwargs):
+        self.actualizar_numeros()
+        super(CaracSurcoPetroglifo, self).save(*args, **kwargs)
+
     class Meta:
         verbose_name = '13.3. Petroglifo'
         verbose_name_plural = '24. Características del surco grabado'
@@ -1986,3 +2047,183 @@ class SupervisadoPiedra(SupervisadoPor):
     class Meta:
         verbose_name = 'Ficha Supervisada Por'
         verbose_name_plural = '18. Ficha Supervisada Por'
+
+########################################################################################
+# Cola de actualizacion del indice de busqueda
+########################################################################################
+
+class ColaIndice(models.Model):
+
+    """Registra los yacimientos y piedras modificados que deben reindexarse.
+    La llena anarapp.signals y la vacia el comando procesar_cola_indice"""
+
+    OPCIONES_MODELO = (
+        ('yacimiento', 'Yacimiento'),
+        ('piedra', 'Piedra'),
+    )
+
+    modelo = models.CharField('Modelo', max_length=20, choices = OPCIONES_MODELO)
+    objeto = models.IntegerField('Id del objeto')
+    fecha = models.DateTimeField('Fecha', auto_now_add = True)
+
+    def __unicode__(self):
+        return self.modelo + ' ' + str(self.objeto)
+
+    class Meta:
+        verbose_name = 'Cola del indice'
+        verbose_name_plural = 'Cola del indice'
+
+########################################################################################
+# Resumen de yacimientos
+########################################################################################
+
+class ResumenQuerySet(models.query.QuerySet):
+
+    """Filtros por conjuntos de codigos sobre las mascaras de bits del resumen.
+    El grupo es una clave de anarapp.codigos.GRUPOS_RESUMEN y los codigos una lista
+    de enteros de su tabla"""
+
+    def _columna(self, grupo):
+        if grupo not in GRUPOS_RESUMEN:
+            raise ValueError('Grupo de codigos desconocido: %s' % grupo)
+
+        qn = connection.ops.quote_name
+        return '%s.%s' % (qn(self.model._meta.db_table), qn('mascara_' + grupo))
+
+    def con_todos(self, grupo, lista):
+        "Yacimientos que tienen todos los codigos dados del grupo"
+        valor = mascara(lista)
+        return self.extra(where=['(%s & %%s) = %%s' % self._columna(grupo)], params=[valor, valor])
+
+    def con_alguno(self, grupo, lista):
+        "Yacimientos que tienen al menos uno de los codigos dados del grupo"
+        return self.extra(where=['(%s & %%s) <> 0' % self._columna(grupo)], params=[mascara(lista)])
+
+    def con_ninguno(self, grupo, lista):
+        "Yacimientos que no tienen ninguno de los codigos dados del grupo"
+        return self.extra(where=['(%s & %%s) = 0' % self._columna(grupo)], params=[mascara(lista)])
+
+class ResumenManager(models.Manager):
+
+    def get_query_set(self):
+        return ResumenQuerySet(self.model, using=self._db)
+
+    def con_todos(self, grupo, lista):
+        return self.get_query_set().con_todos(grupo, lista)
+
+    def con_alguno(self, grupo, lista):
+        return self.get_query_set().con_alguno(grupo, lista)
+
+    def con_ninguno(self, grupo, lista):
+        return self.get_query_set().con_ninguno(grupo, lista)
+
+class ResumenYacimiento(models.Model):
+
+    """Copia aplanada, una fila por yacimiento, de los datos de la ficha que usan el
+    indice de busqueda y los cruces. Los grupos de codigos (ver anarapp.codigos) se
+    guardan como listas de enteros separados por comas. La mantiene anarapp.resumen"""
+
+    yacimiento = models.OneToOneField(Yacimiento, related_name='ResumenYacimiento')
+
+    codigo = models.CharField('Codigo ANAR', max_length=20, db_index = True)
+    pais = CharField('Pais', blank = True)
+    nombre = CharField('Nombre', blank = True)
+    estado = CharField('Estado', blank = True, db_index = True)
+    municipio = CharField('Municipio', blank = True)
+    localidad = CharField('Localidad', blank = True)
+    fotografia = models.BooleanField('Fotografia')
+
+    tipo = models.CommaSeparatedIntegerField('Tipo', max_length=100, blank = True)
+    exposicion = models.CommaSeparatedIntegerField('Exposicion', max_length=100, blank = True)
+    manifestacion = models.CommaSeparatedIntegerField('Manifestacion', max_length=100, blank = True)
+    ubicacion = models.CommaSeparatedIntegerField('Ubicacion', max_length=100, blank = True)
+    material = models.CommaSeparatedIntegerField('Material', max_length=100, blank = True)
+    conservacion = models.CommaSeparatedIntegerField('Conservacion', max_length=100, blank = True)
+    manifasociadas = models.CommaSeparatedIntegerField('Manifestaciones asociadas', max_length=100, blank = True)
+    carasurcopetrotipo = models.CommaSeparatedIntegerField('Tipo de surco del petroglifo', max_length=100, blank = True)
+    cronologia = models.CommaSeparatedIntegerField('Cronologia tentativa', max_length=100, blank = True)
+    carasurcopetroancho = CharField('Ancho del surco del petroglifo', blank = True)
+    carasurcopetroprofun = CharField('Profundidad del surco del petroglifo', blank = True)
+
+    mascara_tipo = models.IntegerField('Mascara de tipo', default = 0)
+    mascara_exposicion = models.IntegerField('Mascara de exposicion', default = 0)
+    mascara_manifestacion = models.IntegerField('Mascara de manifestacion', default = 0)
+    mascara_ubicacion = models.IntegerField('Mascara de ubicacion', default = 0)
+    mascara_material = models.IntegerField('Mascara de material', default = 0)
+    mascara_conservacion = models.IntegerField('Mascara de conservacion', default = 0)
+    mascara_manifasociadas = models.IntegerField('Mascara de manifestaciones asociadas', default = 0)
+    mascara_carasurcopetrotipo = models.IntegerField('Mascara de tipo de surco del petroglifo', default = 0)
+    mascara_cronologia = models.IntegerField('Mascara de cronologia tentativa', default = 0)
+
+    objects = ResumenManager()
+
+    def codigos(self, grupo):
+        "Retorna la lista de codigos guardada para el grupo dado"
+        return [int(codigo) for codigo in getattr(self, grupo).split(',') if codigo]
+
+    def __unicode__(self):
+        return self.codigo
+
+    class Meta:
+        verbose_name = 'Resumen de yacimiento'
+        verbose_name_plural = 'Resumenes de yacimientos'
+
+class DocumentoBusqueda(models.Model):
+
+    """Documento del indice de busqueda en PostgreSQL (ver anarapp.postgres_backend).
+    La columna vector (tsvector con indice GIN) no es un campo de Django: la crea la
+    migracion y la calcula un trigger a partir de texto"""
+
+    identificador = models.CharField('Identificador', max_length=255, unique = True)
+    django_ct = models.CharField('Modelo', max_length=100, db_index = True)
+    django_id = models.CharField('Id', max_length=100)
+    texto = models.TextField('Texto', blank = True)
+    datos = models.TextField('Campos guardados en JSON', blank = True)
+
+    def __unicode__(self):
+        return self.identificador
+
+    class Meta:
+        verbose_name = 'Documento de busqueda'
+        verbose_name_plural = 'Documentos de busqueda'
+
+class CampoBusqueda(models.Model):
+
+    """Un valor de un campo del indice de un documento; los campos multivaluados tienen
+    una fila por valor. Tambien tiene su columna vector calculada por trigger"""
+
+    documento = models.ForeignKey(DocumentoBusqueda, related_name='CampoBusqueda')
+    campo = models.CharField('Campo', max_length=100)
+    valor = models.TextField('Valor', blank = True)
+    # Los valores numericos tambien se guardan como numero, para compararlos y ordenarlos
+    # como numeros y no como texto ('9' < '10')
+    numero = models.FloatField('Numero', null = True)
+
+    def __unicode__(self):
+        return self.campo
+
+    class Meta:
+        verbose_name = 'Campo de busqueda'
+        verbose_name_plural = 'Campos de busqueda'
+
+class VersionSeccion(models.Model):
+
+    """Version de una seccion (un inline) de la ficha de un yacimiento o una piedra.
+    Cada guardado de la seccion la incrementa; al guardar una sola seccion se compara
+    con la version que tenia el formulario (ver anarapp.admin.PestanasAdmin)"""
+
+    modelo = models.CharField('Modelo', max_length=100)
+    objeto_id = models.IntegerField('Id')
+    seccion = models.CharField('Seccion', max_length=100)
+    version = models.IntegerField('Version', default = 0)
+
+    def __unicode__(self):
+        return '%s %s %s' % (self.modelo, self.objeto_id, self.seccion)
+
+    class Meta:
+        unique_together = ('modelo', 'objeto_id', 'seccion')
+        verbose_name = 'Version de seccion'
+        verbose_name_plural = 'Versiones de secciones'
+
+# Registro de las señales que mantienen la cola del indice y los resumenes
+import anarapp.signals
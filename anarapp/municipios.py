@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+########################################################################################
+# Municipios por estado
+# Tabla estado -> municipios que cada proceso guarda en memoria ya convertida a JSON.
+# El formulario del yacimiento la pide una sola vez y elige los municipios del estado en
+# el navegador, sin consultar /chaining/ en cada cambio de estado. Se reconstruye cuando
+# cambia la version CLAVE_MUNICIPIOS, es decir, al guardar o borrar un estado o municipio.
+########################################################################################
+
+import hashlib
+import json
+
+from anarapp.models import Municipio
+from anarapp.versiones import version_datos, nueva_version, CLAVE_MUNICIPIOS
+
+class TablaMunicipios(object):
+
+	""" Contenido JSON {estado: [[municipio, nombre], ...]} con su ETag, que depende
+	solo del contenido para que sea el mismo en todos los procesos """
+
+	def __init__(self):
+		self.version = None
+		self.contenido = None
+		self.etag = None
+
+	def construir(self, filas):
+		""" Reemplaza el contenido por las filas (estado, municipio, nombre) """
+
+		tabla = {}
+		for estado, municipio, nombre in filas:
+			tabla.setdefault(estado, []).append([municipio, nombre])
+
+		self.contenido = json.dumps(tabla, sort_keys=True)
+		self.etag = hashlib.md5(self.contenido).hexdigest()
+
+_tabla = TablaMunicipios()
+
+def tabla():
+	""" Retorna la tabla del proceso, construyendola la primera vez y cada vez que
+	cambiaron los estados o municipios """
+
+	version = version_datos(CLAVE_MUNICIPIOS)
+	if _tabla.version != version:
+		_tabla.construir(Municipio.objects.order_by('estado', 'nombre').values_list('estado', 'id', 'nombre'))
+		_tabla.version = version
+	return _tabla
+
+def invalidar():
+	nueva_version(CLAVE_MUNICIPIOS)
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+########################################################################################
+# Lectura de numeros guardados como texto
+# Las coordenadas y medidas de la ficha se guardan como texto libre ('12,5 cm',
+# '67°12'30" W', '-66.97'). Estas funciones extraen su valor numerico.
+########################################################################################
+
+import re
+
+NUMERO = re.compile(r'[-+]?\d+(?:[.,]\d+)?')
+
+OESTE_SUR = re.compile(r'\b(W|O|OESTE|S|SUR)\b', re.UNICODE)
+ESTE = re.compile(r'\b(E|ESTE)\b', re.UNICODE)
+
+def _valor(texto):
+	return float(texto.replace(',', '.'))
+
+def numero(texto):
+	""" Retorna el primer numero que aparece en el texto, o None si no hay ninguno """
+
+	if not texto:
+		return None
+
+	encontrado = NUMERO.search(texto)
+	if encontrado is None:
+		return None
+	return _valor(encontrado.group())
+
+def coordenada(texto):
+	""" Convierte a grados decimales una coordenada escrita en grados decimales o en
+	grados, minutos y segundos. Los hemisferios sur y oeste (S, W, O) dan valores
+	negativos. Retorna None si el texto no se reconoce como coordenada """
+
+	if not texto:
+		return None
+
+	texto = texto.strip().upper()
+	partes = NUMERO.findall(texto)
+	if not partes or len(partes) > 3:
+		return None
+
+	valores = [_valor(parte) for parte in partes]
+	grados = abs(valores[0])
+	for posicion, valor in enumerate(valores[1:]):
+		if valor < 0 or valor >= 60:
+			return None
+		grados += valor / (60.0 ** (posicion + 1))
+
+	if valores[0] < 0 or OESTE_SUR.search(texto):
+		grados = -grados
+	return grados
+
+def latitud(texto):
+	""" Latitud en grados decimales, o None si no es valida """
+
+	valor = coordenada(texto)
+	if valor is None or not -90 <= valor <= 90:
+		return None
+	return valor
+
+def longitud(texto):
+	""" Longitud en grados decimales, o None si no es valida. El campo de la ficha es
+	'Long. O(W)', asi que los valores positivos sin hemisferio se toman como oeste """
+
+	valor = coordenada(texto)
+	if valor is None or not -180 <= valor <= 180:
+		return None
+	if valor > 0 and not ESTE.search(texto.upper()):
+		valor = -valor
+	return valor
+
+UTM = re.compile(r'^\s*(\d{1,2})\s*([C-HJ-NP-X])?\b(.*)$', re.UNICODE)
+
+def utm(texto):
+	""" Lee una coordenada UTM escrita como zona, banda opcional, este y norte
+	('19P 456789 1234567'). Retorna (zona, banda, este, norte) o None """
+
+	if not texto:
+		return None
+
+	encontrado = UTM.match(texto.strip().upper())
+	if encontrado is None:
+		return None
+
+	zona = int(encontrado.group(1))
+	resto = [_valor(parte) for parte in NUMERO.findall(encontrado.group(3))]
+	if not 1 <= zona <= 60 or len(resto) != 2:
+		return None
+
+	este, norte = resto
+	if not 100000 <= este <= 900000 or not 0 <= norte <= 10000000:
+		return None
+	return zona, encontrado.group(2) or '', este, norte
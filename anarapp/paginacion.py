@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+########################################################################################
+# Paginacion por clave y conteo aproximado
+# Los resultados de busqueda se ordenan por el campo orden (codigo, modelo e id, ver
+# search_indexes.OrdenField) y cada pagina pide al indice solo los documentos que
+# siguen a la ultima clave mostrada, sin saltar las anteriores.
+# El token de continuacion lleva esa clave, cuantos resultados ya se vieron y el total.
+# Las busquedas por texto se ordenan por relevancia; el puntaje no es un campo del
+# indice y no sirve de clave, asi que sus paginas se piden por posicion.
+# El admin conserva sus numeros de pagina pero estima el total con el planificador de
+# PostgreSQL cuando la tabla es grande.
+########################################################################################
+
+import base64
+import json
+import re
+
+from django.core.paginator import Paginator, PageNotAnInteger
+from django.db import connections
+
+# Campo del indice por el que se ordena y se continua. Debe ser unico por documento:
+# con una clave repetida en el borde de una pagina se saltarian los demas
+CAMPO_CLAVE = 'orden'
+
+# Por debajo de esta estimacion se cuenta exactamente
+UMBRAL_CONTEO = 1000
+
+FILAS_PLAN = re.compile(r'rows=(\d+)')
+
+def codificar(clave, vistos, total):
+	return base64.urlsafe_b64encode(json.dumps([clave, vistos, total]))
+
+def decodificar(token):
+	""" Retorna (clave, vistos, total) del token, o None si no es valido """
+
+	try:
+		clave, vistos, total = json.loads(base64.urlsafe_b64decode(str(token)))
+		return unicode(clave), int(vistos), int(total)
+	except (TypeError, ValueError, UnicodeError):
+		return None
+
+class PaginaClave(object):
+
+	""" Pagina de resultados con la misma interfaz que usa la plantilla de una pagina
+	de Django (object_list, has_next, start_index, paginator.count...) y los tokens para
+	ir a la pagina anterior y a la siguiente """
+
+	def __init__(self, object_list, vistos, total, anterior, siguiente):
+		self.object_list = object_list
+		self.vistos = vistos
+		self.count = total
+		self.paginator = self
+		self.anterior = anterior
+		self.siguiente = siguiente
+
+	def has_previous(self):
+		return self.anterior is not None
+
+	def has_next(self):
+		return self.siguiente is not None
+
+	def has_other_pages(self):
+		return self.has_previous() or self.has_next()
+
+	def start_index(self):
+		return self.vistos + 1 if self.object_list else 0
+
+	def end_index(self):
+		return self.vistos + len(self.object_list)
+
+def pagina_por_clave(sqs, cantidad, despues=None, antes=None):
+	""" Retorna la pagina de cantidad resultados que sigue al token despues, o que
+	precede al token antes. Sin token retorna la primera pagina """
+
+	despues = despues and decodificar(despues)
+	antes = antes and decodificar(antes)
+
+	if antes:
+		clave, vistos, total = antes
+		consulta = sqs.filter(**{CAMPO_CLAVE + '__lt': clave}).order_by('-' + CAMPO_CLAVE)
+		resultados = list(consulta[:cantidad])
+		resultados.reverse()
+		vistos = max(vistos - len(resultados), 0)
+		hay_siguiente = True
+		# El total se toma del token: es el que se conto al avanzar
+	else:
+		clave, vistos, total = despues or (None, 0, 0)
+		consulta = sqs.order_by(CAMPO_CLAVE)
+		if clave is not None:
+			consulta = consulta.filter(**{CAMPO_CLAVE + '__gt': clave})
+		# Un resultado de mas indica si hay pagina siguiente
+		resultados = list(consulta[:cantidad + 1])
+		hay_siguiente = len(resultados) > cantidad
+		resultados = resultados[:cantidad]
+		# El indice ya conto los restantes al buscar, len() no vuelve a consultar
+		total = vistos + len(consulta)
+
+	anterior = siguiente = None
+	if resultados and vistos:
+		anterior = codificar(getattr(resultados[0], CAMPO_CLAVE), vistos, total)
+	if resultados and hay_siguiente:
+		siguiente = codificar(getattr(resultados[-1], CAMPO_CLAVE), vistos + len(resultados), total)
+
+	return PaginaClave(resultados, vistos, total, anterior, siguiente)
+
+def pagina_por_puntaje(sqs, cantidad, despues=None, antes=None):
+	""" Igual que pagina_por_clave pero en el orden de relevancia del indice. El token
+	solo lleva la posicion: el indice salta los resultados anteriores """
+
+	token = decodificar(despues or antes or '')
+	vistos = token[1] if token else 0
+	if antes and token:
+		vistos = max(vistos - cantidad, 0)
+
+	resultados = list(sqs[vistos:vistos + cantidad])
+	# El indice ya conto los resultados al traer la pagina
+	total = len(sqs)
+
+	anterior = codificar(u'', vistos, total) if resultados and vistos else None
+	siguiente = None
+	if resultados and vistos + len(resultados) < total:
+		siguiente = codificar(u'', vistos + len(resultados), total)
+
+	return PaginaClave(resultados, vistos, total, anterior, siguiente)
+
+def estimar(queryset):
+	""" Retorna la cantidad de filas que el planificador de PostgreSQL estima para la
+	consulta, sin ejecutarla """
+
+	sql, params = queryset.query.sql_with_params()
+	cursor = connections[queryset.db].cursor()
+	cursor.execute('EXPLAIN ' + sql, params)
+	plan = FILAS_PLAN.search(cursor.fetchone()[0])
+	return int(plan.group(1)) if plan else None
+
+class PaginadorAproximado(Paginator):
+
+	""" Paginador del admin que no cuenta las filas de listados grandes en cada pagina.
+	Si el planificador estima menos de umbral filas cuenta exactamente; por encima usa
+	la estimacion. Los numeros de pagina fuera de rango llevan a la ultima pagina, asi
+	una estimacion mayor que el total real no termina en el error del admin """
+
+	umbral = UMBRAL_CONTEO
+
+	def __init__(self, *args, **kwargs):
+		super(PaginadorAproximado, self).__init__(*args, **kwargs)
+		self.aproximado = False
+
+	def _get_count(self):
+		if self._count is None:
+			estimado = estimar(self.object_list)
+			if estimado is None or estimado < self.umbral:
+				self._count = self.object_list.count()
+			else:
+				self._count = estimado
+				self.aproximado = True
+		return self._count
+	count = property(_get_count)
+
+	def validate_number(self, number):
+		try:
+			number = int(number)
+		except (TypeError, ValueError):
+			raise PageNotAnInteger('That page number is not an integer')
+		return min(max(number, 1), max(self.num_pages, 1))
+
+	def page(self, number):
+		pagina = super(PaginadorAproximado, self).page(number)
+		if self.aproximado and pagina.number > 1 and not len(pagina.object_list):
+			# La estimacion era mayor que el total: se cuenta y se va a la ultima pagina
+			self._count = self.object_list.count()
+			self._num_pages = None
+			self.aproximado = False
+			pagina = super(PaginadorAproximado, self).page(number)
+		return pagina
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+
+########################################################################################
+# Backend de haystack sobre la busqueda de texto completo de PostgreSQL
+# Cada documento del indice es una fila de DocumentoBusqueda y cada valor de sus campos
+# una fila de CampoBusqueda. Las columnas tsvector, sus indices GIN y los triggers que
+# las calculan los crea la migracion 0027, con la configuracion 'espanol' (stemmer en
+# español precedido de unaccent). Se activa en HAYSTACK_CONNECTIONS con el ENGINE
+# 'anarapp.postgres_backend.PostgresEngine'; no hay archivo de indice que reconstruir
+# y todos los servidores de la aplicacion comparten la misma base de datos.
+# La migracion 0029 agrega los indices sobre (campo, valor) y (campo, clave sin acentos)
+# que usan las comparaciones, los rangos, el orden y los filtros exact. Los valores
+# numericos se guardan ademas en la columna numero (migracion 0030), y se comparan y
+# ordenan por ella.
+########################################################################################
+
+import json
+import re
+
+from django.db import connections, transaction
+from django.utils.encoding import force_unicode
+
+from haystack.backends import BaseEngine, BaseSearchBackend, BaseSearchQuery, log_query
+from haystack.constants import ID, DJANGO_CT, DJANGO_ID, DEFAULT_ALIAS
+from haystack.models import SearchResult
+from haystack.utils import get_identifier
+
+from anarapp.models import DocumentoBusqueda, CampoBusqueda
+
+CONFIGURACION = 'public.espanol'
+
+TSQUERY = "plainto_tsquery('%s', %%s)" % CONFIGURACION
+PREFIJO = "to_tsquery('%s', %%s)" % CONFIGURACION
+# Debe ser la misma expresion del indice de la migracion 0029 para que se use
+CLAVE = 'lower(public.sin_acentos(%s))'
+
+DOCUMENTOS = DocumentoBusqueda._meta.db_table
+CAMPOS = CampoBusqueda._meta.db_table
+
+# Tipos de campo de haystack que se guardan tambien en la columna numero
+NUMERICOS = ('integer', 'float')
+
+FRASE = re.compile(r'"(?P<frase>.*?)"')
+PALABRA = re.compile(r'\w+', re.UNICODE)
+
+def valor_texto(valor):
+	""" Representacion en texto de un valor del indice, como la guarda Whoosh """
+
+	if isinstance(valor, bool):
+		return u'true' if valor else u'false'
+	return force_unicode(valor)
+
+def valor_numero(valor):
+	""" El valor como numero si es numerico, o None """
+
+	if isinstance(valor, (int, long, float)) and not isinstance(valor, bool):
+		return float(valor)
+	return None
+
+def terminos(texto):
+	""" Separa una consulta escrita por el usuario en frases entre comillas y palabras.
+	Retorna las listas de terminos a incluir y a excluir (los que empiezan con '-') """
+
+	incluir, excluir = [], []
+	frases = FRASE.findall(texto)
+	for parte in FRASE.split(texto):
+		if parte in frases:
+			incluir.append(parte)
+			continue
+		for palabra in parte.split():
+			if palabra.startswith('-') and len(palabra) > 1:
+				excluir.append(palabra[1:])
+			elif palabra != '-':
+				incluir.append(palabra)
+	return incluir, excluir
+
+class PostgresSearchBackend(BaseSearchBackend):
+
+	def __init__(self, connection_alias, **connection_options):
+		super(PostgresSearchBackend, self).__init__(connection_alias, **connection_options)
+		self.using = connection_options.get('DATABASE', 'default')
+
+	def update(self, index, iterable, commit=True):
+		contenido = index.get_content_field()
+		reservados = set([ID, DJANGO_CT, DJANGO_ID, contenido])
+
+		with transaction.commit_on_success(using=self.using):
+			for obj in iterable:
+				doc = index.full_prepare(obj)
+				DocumentoBusqueda.objects.using(self.using).filter(identificador=doc[ID]).delete()
+
+				datos = dict((campo, valor) for campo, valor in doc.items() if campo not in reservados)
+				documento = DocumentoBusqueda.objects.using(self.using).create(identificador=doc[ID],
+					django_ct=doc[DJANGO_CT], django_id=doc[DJANGO_ID],
+					texto=force_unicode(doc.get(contenido) or u''),
+					datos=json.dumps(datos, default=valor_texto))
+
+				campos = []
+				for campo, valor in datos.items():
+					for elemento in (valor if isinstance(valor, (list, tuple, set)) else [valor]):
+						if elemento is not None:
+							campos.append(CampoBusqueda(documento=documento, campo=campo, valor=valor_texto(elemento),
+									numero=valor_numero(elemento)))
+				CampoBusqueda.objects.using(self.using).bulk_create(campos)
+
+	def remove(self, obj_or_string, commit=True):
+		identificador = get_identifier(obj_or_string)
+		with transaction.commit_on_success(using=self.using):
+			DocumentoBusqueda.objects.using(self.using).filter(identificador=identificador).delete()
+
+	def clear(self, models=[], commit=True):
+		documentos = DocumentoBusqueda.objects.using(self.using)
+		if models:
+			documentos = documentos.filter(django_ct__in=[self._ct(model) for model in models])
+
+		with transaction.commit_on_success(using=self.using):
+			CampoBusqueda.objects.using(self.using).filter(documento__in=documentos.values('id')).delete()
+			documentos.delete()
+
+	def _ct(self, model):
+		return '%s.%s' % (model._meta.app_label, model._meta.module_name)
+
+	@log_query
+	def search(self, query_string, sort_by=None, start_offset=0, end_offset=None, models=None,
+			result_class=None, params=(), rango=None, **kwargs):
+		""" Ejecuta la condicion SQL armada por PostgresSearchQuery. Trae la pagina y el
+		total de resultados en una sola consulta """
+
+		from haystack import connections as haystack_connections
+		indexados = haystack_connections[self.connection_alias].get_unified_index().get_indexed_models()
+		modelos = [model for model in (models or indexados) if model in indexados]
+		if not modelos:
+			return {'results': [], 'hits': 0}
+
+		parametros = []
+		if rango:
+			puntaje = 'ts_rank(d.vector, %s)' % rango[0]
+			parametros.extend(rango[1])
+		else:
+			puntaje = '0'
+
+		# Cada campo de orden se une una sola vez con su menor valor por documento, en
+		# lugar de una subconsulta por cada documento encontrado
+		uniones, orden = [], []
+		for numero, campo in enumerate(sort_by or ()):
+			sentido = 'DESC' if campo.startswith('-') else 'ASC'
+			uniones.append('LEFT JOIN (SELECT c.documento_id, min(c.numero) AS numero, min(c.valor) AS valor '
+				'FROM %s c WHERE c.campo = %%s GROUP BY c.documento_id) o%d ON o%d.documento_id = d.id' % (CAMPOS, numero, numero))
+			# Los campos numericos se ordenan por numero; en los de texto es nulo
+			orden.append('o%d.numero %s, o%d.valor %s' % (numero, sentido, numero, sentido))
+			parametros.append(campo.lstrip('-'))
+		if rango:
+			orden.append('puntaje DESC')
+		orden.append('d.id')
+
+		donde = '(%s) AND d.django_ct IN (%s)' % (query_string, ', '.join(['%s'] * len(modelos)))
+		parametros.extend(params)
+		parametros.extend(self._ct(model) for model in modelos)
+
+		sql = 'SELECT d.django_ct, d.django_id, d.datos, %s AS puntaje, count(*) OVER () FROM %s d %s WHERE %s ORDER BY %s' % \
+			(puntaje, DOCUMENTOS, ' '.join(uniones), donde, ', '.join(orden))
+		if end_offset is not None:
+			sql += ' LIMIT %d' % max(end_offset - start_offset, 0)
+		if start_offset:
+			sql += ' OFFSET %d' % start_offset
+
+		cursor = connections[self.using].cursor()
+		cursor.execute(sql, parametros)
+		filas = cursor.fetchall()
+
+		if filas:
+			hits = filas[0][4]
+		elif start_offset:
+			# La pagina pedida esta despues del ultimo resultado
+			cursor.execute('SELECT count(*) FROM %s d WHERE %s' % (DOCUMENTOS, donde),
+				list(params) + [self._ct(model) for model in modelos])
+			hits = cursor.fetchone()[0]
+		else:
+			hits = 0
+
+		result_class = result_class or SearchResult
+		resultados = []
+		for django_ct, django_id, datos, score, total in filas:
+			app_label, model_name = django_ct.split('.')
+			guardados = dict((str(campo), valor) for campo, valor in json.loads(datos or '{}').items())
+			resultados.append(result_class(app_label, model_name, django_id, score, **guardados))
+
+		return {'results': resultados, 'hits': hits}
+
+	def more_like_this(self, model_instance, additional_query_string=None, result_class=None, **kwargs):
+		return {'results': [], 'hits': 0}
+
+class PostgresSearchQuery(BaseSearchQuery):
+
+	""" Traduce el arbol de filtros de haystack a una condicion SQL sobre los documentos
+	(alias d). Los valores viajan como parametros, nunca dentro del texto del SQL """
+
+	def __init__(self, using=DEFAULT_ALIAS):
+		super(PostgresSearchQuery, self).__init__(using=using)
+		self._parametros = []
+		self._contenido = []
+
+	def matching_all_fragment(self):
+		return 'TRUE'
+
+	def build_query(self):
+		# Los impulsos (boost) de haystack no tienen equivalente aqui y se ignoran
+		self._parametros = []
+		self._contenido = []
+		consulta = self.query_filter.as_query_string(self.build_query_fragment)
+		return consulta or self.matching_all_fragment()
+
+	def build_params(self, spelling_query=None, **kwargs):
+		kwargs.update(super(PostgresSearchQuery, self).build_params(spelling_query))
+		kwargs['params'] = list(self._parametros)
+		if self._contenido:
+			kwargs['rango'] = (' && '.join(sql for sql, params in self._contenido),
+				[param for sql, params in self._contenido for param in params])
+		return kwargs
+
+	def build_query_fragment(self, field, filter_type, value):
+		from haystack import connections as haystack_connections
+
+		automatica = False
+		if hasattr(value, 'values_list'):
+			value = list(value)
+		if hasattr(value, 'input_type_name'):
+			automatica = value.input_type_name == 'auto_query'
+			value = value.query_string
+
+		if field == 'content':
+			sql, params = self._texto(value, automatica)
+		else:
+			unified_index = haystack_connections[self._using].get_unified_index()
+			campo = unified_index.get_index_fieldname(field)
+			tipo = getattr(unified_index.all_searchfields().get(campo), 'field_type', None)
+			condicion, params = self._condicion(filter_type, value, tipo in NUMERICOS)
+			sql = 'd.id IN (SELECT c.documento_id FROM %s c WHERE c.campo = %%s AND %s)' % (CAMPOS, condicion)
+			params = [campo] + params
+
+		self._parametros.extend(params)
+		return sql
+
+	def _texto(self, value, automatica):
+		""" Condicion sobre el texto completo del documento. Las consultas automaticas
+		admiten frases entre comillas y palabras excluidas con '-' """
+
+		if automatica:
+			incluir, excluir = terminos(value)
+		else:
+			incluir, excluir = [valor_texto(value)], []
+
+		partes = [TSQUERY] * len(incluir) + ['!!' + TSQUERY] * len(excluir)
+		if not partes:
+			return 'TRUE', []
+
+		if incluir:
+			self._contenido.append((' && '.join([TSQUERY] * len(incluir)), list(incluir)))
+		return 'd.vector @@ (%s)' % ' && '.join(partes), incluir + excluir
+
+	def _condicion(self, filter_type, value, numerico=False):
+		""" Condicion sobre los valores de un campo (alias c). Los rangos y comparaciones
+		de los campos numericos usan la columna numero """
+
+		if filter_type == 'in':
+			valores = [valor_texto(valor) for valor in value]
+			if not valores:
+				return 'FALSE', []
+			return 'c.vector @@ (%s)' % ' || '.join([TSQUERY] * len(valores)), valores
+
+		# Como texto '10' < '9': los campos numericos se comparan con la columna numero
+		columna, convertir = ('c.numero', float) if numerico else ('c.valor', valor_texto)
+
+		if filter_type == 'range':
+			return '%s BETWEEN %%s AND %%s' % columna, [convertir(value[0]), convertir(value[1])]
+
+		comparaciones = {'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<='}
+		if filter_type in comparaciones:
+			return '%s %s %%s' % (columna, comparaciones[filter_type]), [convertir(value)]
+
+		if filter_type == 'exact':
+			return '%s = %s' % (CLAVE % 'c.valor', CLAVE % '%s'), [valor_texto(value)]
+
+		if filter_type == 'startswith':
+			palabras = PALABRA.findall(valor_texto(value))
+			if not palabras:
+				return 'TRUE', []
+			return 'c.vector @@ %s' % PREFIJO, [u' & '.join(palabras) + u':*']
+
+		return 'c.vector @@ %s' % TSQUERY, [valor_texto(value)]
+
+class PostgresEngine(BaseEngine):
+	backend = PostgresSearchBackend
+	query = PostgresSearchQuery
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+from anarapp.models import Yacimiento
+import dynamic
+
+def cargar_relaciones(yacimientos, modelos):
+	""" Carga con una sola consulta por modelo las filas de los modelos dados que
+	pertenecen a un lote de yacimientos. Retorna un diccionario id de yacimiento -> ficha,
+	donde la ficha es un diccionario nombre de modelo -> instancia (o None) para las
+	relaciones uno a uno, o lista de instancias para las relaciones uno a muchos """
+
+	return cargar_fichas([yacimiento.id for yacimiento in yacimientos], modelos)
+
+def cargar_fichas(ids, modelos):
+	""" Igual que cargar_relaciones, pero recibe directamente los ids de los yacimientos """
+
+	fichas = dict((i, {}) for i in ids)
+
+	for modelo in modelos:
+		nombre = modelo.__name__
+		multiple = dynamic.get_type(modelo, 'yacimiento') == 'ForeignKey'
+
+		for ficha in fichas.values():
+			ficha[nombre] = [] if multiple else None
+
+		if not ids:
+			continue
+
+		for fila in modelo.objects.filter(yacimiento__in=ids):
+			if multiple:
+				fichas[fila.yacimiento_id][nombre].append(fila)
+			else:
+				fichas[fila.yacimiento_id][nombre] = fila
+
+	return fichas
+
+def relaciones_yacimiento():
+	""" Retorna los nombres de los accesos desde Yacimiento a sus modelos relacionados,
+	separados en relaciones uno a uno y relaciones uno a muchos """
+
+	uno, varios = [], []
+	for relacion in Yacimiento._meta.get_all_related_objects():
+		if relacion.field.unique:
+			uno.append(relacion.get_accessor_name())
+		else:
+			varios.append(relacion.get_accessor_name())
+	return uno, varios
+
+def ficha_completa():
+	""" Retorna un queryset de yacimientos que trae la ficha completa con una consulta
+	para el yacimiento y sus relaciones uno a uno, mas una consulta por cada relacion
+	uno a muchos (fotografias, croquis, colores, bibliografia, piedras...) """
+
+	uno, varios = relaciones_yacimiento()
+	return Yacimiento.objects.select_related('estado', 'municipio', *uno).prefetch_related(*varios)
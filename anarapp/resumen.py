@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+########################################################################################
+# Resumen de yacimientos
+# Construye y mantiene las filas de ResumenYacimiento a partir de la ficha completa.
+########################################################################################
+
+from django.db.models import get_model
+
+from anarapp import codigos
+from anarapp.models import Yacimiento, ResumenYacimiento
+from anarapp.prefetch import cargar_relaciones, cargar_fichas
+
+# Modelos de la ficha que se copian en el resumen, ademas de las tablas de codigos
+MODELOS_EXTRA = ('LocalidadYacimiento', 'FotografiaYac', 'CaracSurcoPetroglifo')
+
+NOMBRES = tuple(sorted(codigos.modelos() | set(MODELOS_EXTRA)))
+
+# Cantidad de yacimientos resumidos juntos
+LOTE = 500
+
+def relaciones(nombres=NOMBRES):
+	""" Retorna las clases de los modelos de anarapp nombrados """
+
+	return [get_model('anarapp', nombre) for nombre in nombres]
+
+def texto(valor):
+	""" Retorna la representacion en texto de un valor que puede ser None """
+
+	return u'' if valor is None else unicode(valor)
+
+def datos_yacimiento(yacimiento):
+	""" Retorna los campos del resumen que se toman del propio yacimiento """
+
+	return {
+		'codigo': yacimiento.codigo,
+		'pais': texto(yacimiento.pais),
+		'nombre': texto(yacimiento.nombre),
+		'estado': texto(yacimiento.estado),
+		'municipio': texto(yacimiento.municipio),
+	}
+
+def datos_ficha(ficha, nombres=NOMBRES):
+	""" Retorna los campos del resumen que dependen de los modelos nombrados. La ficha
+	debe traer todos los modelos de los grupos de codigos en los que intervienen """
+
+	datos = {}
+
+	if 'LocalidadYacimiento' in nombres:
+		localidad = ficha['LocalidadYacimiento']
+		datos['localidad'] = '' if localidad is None else localidad.nombrePoblado + ' ' + localidad.nombreNoPoblado
+
+	if 'FotografiaYac' in nombres:
+		datos['fotografia'] = bool(ficha['FotografiaYac'])
+
+	if 'CaracSurcoPetroglifo' in nombres:
+		caracpetro = ficha['CaracSurcoPetroglifo']
+		if caracpetro is None:
+			datos['carasurcopetroancho'] = datos['carasurcopetroprofun'] = ''
+		else:
+			datos['carasurcopetroancho'] = caracpetro.anchoDe + ' ' + caracpetro.anchoA
+			datos['carasurcopetroprofun'] = caracpetro.produndidadDe + ' ' + caracpetro.profundidadA
+
+	for grupo in codigos.GRUPOS_RESUMEN:
+		if codigos.modelos([grupo]) & set(nombres):
+			lista = codigos.codigos(ficha, grupo)
+			datos[grupo] = ','.join(str(codigo) for codigo in lista)
+			datos['mascara_' + grupo] = codigos.mascara(lista)
+
+	return datos
+
+def resumir(yacimientos):
+	""" Crea o reemplaza el resumen de los yacimientos dados, cargando sus fichas con
+	una consulta por modelo. Retorna la lista de resumenes en el mismo orden """
+
+	fichas = cargar_relaciones(yacimientos, relaciones())
+	existentes = dict((resumen.yacimiento_id, resumen) for resumen in
+		ResumenYacimiento.objects.filter(yacimiento__in=[yacimiento.id for yacimiento in yacimientos]))
+
+	resumenes = []
+	for yacimiento in yacimientos:
+		resumen = existentes.get(yacimiento.id) or ResumenYacimiento(yacimiento=yacimiento)
+
+		datos = datos_yacimiento(yacimiento)
+		datos.update(datos_ficha(fichas[yacimiento.id]))
+		for campo, valor in datos.items():
+			setattr(resumen, campo, valor)
+
+		resumen.save()
+		resumenes.append(resumen)
+
+	return resumenes
+
+def resumir_faltantes(lote=LOTE):
+	""" Resume por lotes los yacimientos que todavia no tienen resumen. Retorna cuantos
+	se resumieron """
+
+	total = 0
+	while True:
+		yacimientos = list(Yacimiento.objects.filter(ResumenYacimiento__isnull=True)
+			.select_related('estado', 'municipio').order_by('pk')[:lote])
+		if not yacimientos:
+			return total
+		resumir(yacimientos)
+		total += len(yacimientos)
+
+def resumen_de(yacimiento):
+	""" Retorna el resumen del yacimiento, creandolo si todavia no existe. Al indexar
+	ya existe: YacimientoIndex.build_queryset resume antes los que faltan """
+
+	try:
+		resumen = yacimiento.ResumenYacimiento
+	except ResumenYacimiento.DoesNotExist:
+		resumen = None
+
+	if resumen is None:
+		resumen = resumir([yacimiento])[0]
+	return resumen
+
+def actualizar(instancia, borrada=False):
+	""" Actualiza en el resumen solo los campos que dependen de la instancia que se
+	acaba de guardar o borrar, releyendo los modelos que comparten grupo con ella """
+
+	if isinstance(instancia, Yacimiento):
+		if borrada:
+			return
+		if not ResumenYacimiento.objects.filter(yacimiento=instancia).update(**datos_yacimiento(instancia)):
+			resumir([instancia])
+		return
+
+	nombre = instancia.__class__.__name__
+	if nombre not in NOMBRES:
+		return
+
+	necesarios = set([nombre])
+	for grupo in codigos.GRUPOS_RESUMEN:
+		if nombre in codigos.modelos([grupo]):
+			necesarios |= codigos.modelos([grupo])
+
+	yacimiento_id = instancia.yacimiento_id
+	ficha = cargar_fichas([yacimiento_id], relaciones(necesarios))[yacimiento_id]
+	datos = datos_ficha(ficha, necesarios)
+
+	if not ResumenYacimiento.objects.filter(yacimiento=yacimiento_id).update(**datos) and not borrada:
+		resumir([instancia.yacimiento])
@@ -1,5 +1,26 @@
 from haystack import indexes
 from anarapp.models import Yacimiento, Piedra
+from anarapp.resumen import resumen_de, resumir_faltantes
+from anarapp import codigos
+from anarapp.texto import clave_exacta
+
+class ClaveField(indexes.CharField):
+	""" Texto normalizado como un solo termino ('Bolívar' y 'BOLIVAR' -> 'bolivar'),
+	para filtrar por igualdad sin importar acentos ni mayusculas """
+
+	field_type = 'clave'
+
+	def prepare(self, obj):
+		return clave_exacta(super(ClaveField, self).prepare(obj))
+
+class OrdenField(ClaveField):
+	""" Clave del codigo seguida del modelo y del id con ceros a la izquierda
+	('v_1.anarapp.piedra.0000000012'). Ordena como la clave del codigo pero no se
+	repite, asi la paginacion por clave no salta documentos con el mismo codigo """
+
+	def prepare(self, obj):
+		return '%s.%s.%s.%010d' % (super(OrdenField, self).prepare(obj),
+			obj._meta.app_label, obj._meta.module_name, obj.pk)
 
 ##################################################
 # Piedra Index
@@ -14,6 +35,13 @@ class PiedraIndex(indexes.SearchIndex, indexes.Indexable):
 	nombre 			= indexes.CharField(model_attr='nombre')
 	figuras 		        = indexes.CharField(model_attr='nombreFiguras')
 
+	#Campos clave para filtros por igualdad
+	nombre_clave		= ClaveField(model_attr='nombre')
+	estado_clave		= ClaveField(model_attr='estado', null=True)
+
+	#Orden y continuacion de los resultados (ver anarapp.paginacion)
+	orden			= OrdenField(model_attr='codigo')
+
 	def get_model(self):
 		return Piedra
 
@@ -35,6 +63,14 @@ class YacimientoIndex(indexes.SearchIndex, indexes.Indexable):
 	estado 			= indexes.CharField(model_attr='estado')
 	nombre 			= indexes.CharField(model_attr='nombre')
 
+	#Campos clave para filtros por igualdad
+	estado_clave		= ClaveField(model_attr='estado', null=True)
+	municipio_clave		= ClaveField(model_attr='municipio', null=True)
+	nombre_clave		= ClaveField(model_attr='nombre')
+
+	#Orden y continuacion de los resultados (ver anarapp.paginacion)
+	orden			= OrdenField(model_attr='codigo')
+
 	localidad 		    = indexes.CharField()
 	fotografia 		= indexes.CharField()
 	tipo 			        = indexes.MultiValueField() 
@@ -55,181 +91,37 @@ class YacimientoIndex(indexes.SearchIndex, indexes.Indexable):
 		return Yacimiento
 
 	def index_queryset(self, using=None):
-		return self.get_model().objects.all()
+		return self.get_model().objects.select_related('estado', 'municipio', 'ResumenYacimiento')
+
+	def build_queryset(self, using=None, start_date=None, end_date=None):
+		#Los yacimientos sin resumen se resumen por lotes antes de indexar, y no uno
+		#por uno dentro de prepare
+		resumir_faltantes()
+		return super(YacimientoIndex, self).build_queryset(using, start_date, end_date)
 
 
 	def prepare(self, obj):
 		self.prepare_data = super(YacimientoIndex, self).prepare(obj)
 		
+		#Los datos de la ficha se leen del resumen del yacimiento (ver anarapp.resumen)
+		resumen = resumen_de(obj)
+		
 		#Localidad Yacimiento
-		try:
-			localidad = obj.LocalidadYacimiento
-			self.prepare_data['localidad'] = localidad.nombrePoblado + ' ' + localidad.nombreNoPoblado
-		except:
-			pass
+		if resumen.localidad:
+			self.prepare_data['localidad'] = resumen.localidad
 		
 		#Fotografias	
-		fotografias = obj.FotografiaYac.all()
-		self.prepare_data['fotografia'] = 'true' if fotografias.count() > 0 else 'false'
-		
-		#Tipo Yacimiento
-		try:
-			tipo = obj.TipoYacimiento
-			self.prepare_data['tipo'] = []
-			
-			if tipo.esParedRocosa:
-				self.prepare_data['tipo'].append(1)
-			if tipo.esRoca:
-				self.prepare_data['tipo'].append(2)
-			if tipo.esDolmen:
-				self.prepare_data['tipo'].append(3)
-			if tipo.esAbrigo:
-				self.prepare_data['tipo'].append(4)
-			if tipo.esCueva:
-				self.prepare_data['tipo'].append(5)
-			if tipo.esCuevadeRec:
-				self.prepare_data['tipo'].append(6)
-			if tipo.esTerrenoSup:
-				self.prepare_data['tipo'].append(7)
-			if tipo.esTerrenoPro:
-				self.prepare_data['tipo'].append(8)
-		except:
-			pass
-			
-		#Exposicion
-		try:
-			exposicion = obj.TipoExposicionYac
-			self.prepare_data['exposicion'] = []			
-			
-			if exposicion.expuesto:
-				self.prepare_data['exposicion'].append(1)
-			#if exposicion.noExpuesto:
-			#	self.prepare_data['exposicion'].append(2)
-			if exposicion.expuestoperiodicamente:
-				self.prepare_data['exposicion'].append(3)
-		except:
-			pass
-			
-		#Manifestaciones
-		manifestaciones = obj.ManifestacionYacimiento.all()			
-		self.prepare_data['manifestacion'] = []
-		
-		for m in manifestaciones:
-			self.prepare_data['manifestacion'].append(m.tipoManifestacion)
-
-		#Ubicacion de la manifestacion
-		ubicaciones = obj.UbicacionYacimiento.all()
-		self.prepare_data['ubicacion'] = []
-
-		for u in ubicaciones:
-			self.prepare_data['ubicacion'].append(u.ubicacionManifestacion)
-
-
-		#Material
-		try:
-			material = obj.MaterialYacimiento
-			self.prepare_data['material'] = []			
-			
-			if material.esRoca and material.esIgnea :
-				self.prepare_data['material'].append(1)
-			if material.esRoca and material.esMetamor:
-				self.prepare_data['material'].append(2)
-			if material.esRoca and materia.esSedimentaria:
-				self.prepare_data['material'].append(3)
-			if material.esTierra:
-				self.prepare_data['material'].append(4)
-			if material.esHueso:
-				self.prepare_data['material'].append(5)
-			if material.esCorteza:
-				self.prepare_data['material'].append(6)
-			if material.esPiel:
-				self.prepare_data['material'].append(7)	
-		except:
-			pass
-
-		#Conservacion
-		try:
-			conservacion = obj.EstadoConserYac
-			self.prepare_data['conservacion'] = []
-						
-			if conservacion.enBuenEstado:
-				self.prepare_data['conservacion'].append(1)
-			if exposicion.estadoModificado:
-				self.prepare_data['conservacion'].append(2)
-			if conservacion.porErosion and conservacion.porErosionParModerada:
-				self.prepare_data['conservacion'].append(3)
-			if conservacion.porErosion and conservacion.porErosionParSevere:
-				self.prepare_data['conservacion'].append(4)
-			if conservacion.porErosion and conservacion.porErosionExtModerada:
-				self.prepare_data['conservacion'].append(5)
-			if conservacion.porErosion and conservacion.porErosionExtSevere:
-				self.prepare_data['conservacion'].append(6)
-		except:
-			pass
-			
+		self.prepare_data['fotografia'] = 'true' if resumen.fotografia else 'false'
 		
-		#Manifestaciones Asociadas
-		try:
-			asociada = obj.ManifestacionesAsociadas
-			self.prepare_data['manifasociadas'] = []
-			
-			if asociada.esLitica:
-				self.prepare_data['manifasociadas'].append(1)
-			if asociada.esCeramica:
-				self.prepare_data['manifasociadas'].append(2)
-			if asociada.esOseo:
-				self.prepare_data['manifasociadas'].append(3)
-			if asociada.esConcha:
-				self.prepare_data['manifasociadas'].append(4)
-			if asociada.esCarbon:
-				self.prepare_data['manifasociadas'].append(5)
-			if asociada.esMito:
-				self.prepare_data['manifasociadas'].append(6)
-			if asociada.esCementerio:
-				self.prepare_data['manifasociadas'].append(7)
-			if asociada.esMonticulo:
-				self.prepare_data['manifasociadas'].append(8)
-		except:
-			pass
+		#Tipo, exposicion, manifestaciones, ubicacion, material, conservacion,
+		#manifestaciones asociadas y tipo de surco del petroglifo
+		for grupo in codigos.GRUPOS:
+			self.prepare_data[grupo] = resumen.codigos(grupo)
 
 		#CaraSurcoPetroglifo
-
-		try:
-			caracpetro = obj.CaracSurcoPetroglifo
-			self.prepare_data['carasurcopetroancho'] = caracpetro.anchoDe + ' ' +caracpetro.anchoA
-			self.prepare_data['carasurcopetroprofun'] = caracpetro.produndidadDe + ' '+caracpetro.profundidadA
-			self.prepare_data['carasurcopetrotipo'] = []
-			if caracpetro.esBase:
-				self.prepare_data['carasurcopetrotipo'].append(1)
-			if caracpetro.esBaseRedonda:
-				self.prepare_data['carasurcopetrotipo'].append(2)
-			if caracpetro.esBaseAguda:
-				self.prepare_data['carasurcopetrotipo'].append(3)
-			if caracpetro.esBajoRelieve:
-				self.prepare_data['carasurcopetrotipo'].append(4)
-			if caracpetro.esBajoRelieveLineal:
-				self.prepare_data['carasurcopetrotipo'].append(5)
-			if caracpetro.esBajoRelievePlanar:
-				self.prepare_data['carasurcopetrotipo'].append(6)
-			if caracpetro.esAltoRelieve:
-				self.prepare_data['carasurcopetrotipo'].append(7)
-			if caracpetro.esAltoRelieveLineal:
-				self.prepare_data['carasurcopetrotipo'].append(8)
-			if caracpetro.esAltoRelievePlanar:
-				self.prepare_data['carasurcopetrotipo'].append(9)
-			if caracpetro.esAreaInterlineal:
-				self.prepare_data['carasurcopetrotipo'].append(10)
-			if caracpetro.esAreaInterlinealPulida:
-				self.prepare_data['carasurcopetrotipo'].append(11)
-			if caracpetro.esAreaInterlinealRebajada:
-				self.prepare_data['carasurcopetrotipo'].append(12)
-			if caracpetro.esGrabadoSuperpuesto:
-				self.prepare_data['carasurcopetrotipo'].append(13)
-			if caracpetro.esGrabadoRebajado:
-				self.prepare_data['carasurcopetrotipo'].append(14)
-
-		except:
-			pass
+		if resumen.carasurcopetroancho:
+			self.prepare_data['carasurcopetroancho'] = [resumen.carasurcopetroancho]
+			self.prepare_data['carasurcopetroprofun'] = [resumen.carasurcopetroprofun]
 
 		return self.prepare_data	
 
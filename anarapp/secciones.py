@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+########################################################################################
+# Versiones de las secciones de la ficha
+# Cada inline de la ficha de un yacimiento o una piedra es una seccion con su propia
+# version en VersionSeccion. Guardar una seccion bloquea solo su fila de version, asi
+# dos personas pueden guardar secciones distintas de la misma ficha a la vez, y se
+# rechaza el guardado si otra persona la cambio despues de abrir el formulario.
+########################################################################################
+
+from django.core.exceptions import ValidationError
+from django.db.models import F
+
+from anarapp.models import VersionSeccion
+
+MENSAJE_CONFLICTO = (u'Otra persona modificó esta sección después de abrir el formulario. '
+	u'Recargue la página antes de guardarla.')
+
+class ConflictoVersion(Exception):
+
+	""" La seccion cambio desde que se abrio el formulario """
+
+	def __init__(self, actual):
+		super(ConflictoVersion, self).__init__(actual)
+		self.actual = actual
+
+def modelo_de(obj):
+	return '%s.%s' % (obj._meta.app_label, obj._meta.module_name)
+
+def versiones(obj):
+	""" Retorna el diccionario seccion -> version del objeto. Las secciones que nunca
+	se guardaron no aparecen y tienen version 0 """
+
+	if obj is None or obj.pk is None:
+		return {}
+	return dict(VersionSeccion.objects.filter(modelo=modelo_de(obj), objeto_id=obj.pk)
+		.values_list('seccion', 'version'))
+
+def bloquear(obj, seccion, esperada=None):
+	""" Retorna la fila de version de la seccion bloqueada hasta el final de la
+	transaccion. Si se da la version esperada y no es la actual lanza ConflictoVersion """
+
+	datos = {'modelo': modelo_de(obj), 'objeto_id': obj.pk, 'seccion': seccion}
+	VersionSeccion.objects.get_or_create(**datos)
+	fila = VersionSeccion.objects.select_for_update().get(**datos)
+	if esperada is not None and fila.version != esperada:
+		raise ConflictoVersion(fila.version)
+	return fila
+
+def incrementar(fila):
+	VersionSeccion.objects.filter(pk=fila.pk).update(version=F('version') + 1)
+	fila.version += 1
+	return fila.version
+
+def con_version(FormSet, obj, esperadas):
+	""" Retorna una subclase de FormSet que, si el formset cambio, bloquea al validarse
+	la version de su seccion y da un error si no es la de esperadas (prefijo -> version,
+	0 para las secciones sin version). La fila bloqueada queda en fila_version """
+
+	class FormSetConVersion(FormSet):
+
+		fila_version = None
+
+		def clean(self):
+			super(FormSetConVersion, self).clean()
+			if self.has_changed():
+				try:
+					self.fila_version = bloquear(obj, self.prefix, esperadas.get(self.prefix, 0))
+				except ConflictoVersion:
+					raise ValidationError(MENSAJE_CONFLICTO)
+
+	FormSetConVersion.__name__ = FormSet.__name__
+	return FormSetConVersion
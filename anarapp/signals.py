@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from anarapp.models import Yacimiento, Piedra, Coordenadas, Datum, Estado, Municipio, ColaIndice, ResumenYacimiento, \
+	DocumentoBusqueda, CampoBusqueda, VersionSeccion
+from anarapp import resumen, autocompletar, municipios
+from anarapp.versiones import nueva_version
+from geoespacial import indice, datum
+
+# Modelos internos cuyos cambios no afectan a las fichas
+MODELOS_INTERNOS = (ColaIndice, ResumenYacimiento, DocumentoBusqueda, CampoBusqueda, VersionSeccion)
+
+def afectados(instance):
+	""" Retorna los pares (modelo, id) de los yacimientos y piedras cuyo documento
+	del indice cambia al guardar o borrar la instancia dada """
+
+	if isinstance(instance, Yacimiento):
+		return [('yacimiento', instance.id)]
+	if isinstance(instance, Piedra):
+		return [('piedra', instance.id)]
+
+	pares = []
+	for modelo in ('yacimiento', 'piedra'):
+		objeto = getattr(instance, modelo + '_id', None)
+		if objeto is not None:
+			pares.append((modelo, objeto))
+	return pares
+
+def es_ficha(sender):
+	""" Indica si el modelo dado es Yacimiento, Piedra o alguno de sus modelos hijos """
+
+	return sender._meta.app_label == 'anarapp' and not issubclass(sender, MODELOS_INTERNOS)
+
+@receiver(post_save)
+@receiver(post_delete)
+def encolar(sender, instance, **kwargs):
+	""" Registra en la cola del indice los objetos afectados por el cambio """
+
+	if not es_ficha(sender):
+		return
+
+	for modelo, objeto in afectados(instance):
+		ColaIndice.objects.create(modelo=modelo, objeto=objeto)
+
+@receiver(post_save)
+@receiver(post_delete)
+def sincronizar_resumen(sender, instance, signal, **kwargs):
+	""" Mantiene al dia el resumen del yacimiento afectado por el cambio """
+
+	if not es_ficha(sender):
+		return
+
+	resumen.actualizar(instance, borrada = signal is post_delete)
+
+@receiver(post_save)
+@receiver(post_delete)
+def cambiar_version(sender, **kwargs):
+	""" Invalida los resultados cacheados que dependen de las fichas """
+
+	if es_ficha(sender):
+		nueva_version()
+
+@receiver(post_save, sender=Yacimiento)
+@receiver(post_delete, sender=Yacimiento)
+@receiver(post_save, sender=Coordenadas)
+@receiver(post_delete, sender=Coordenadas)
+@receiver(post_save, sender=Datum)
+@receiver(post_delete, sender=Datum)
+def actualizar_indice_espacial(sender, instance, signal, **kwargs):
+	""" Recalcula la posicion WGS 84 si cambiaron las coordenadas o el datum, y actualiza
+	la posicion, el codigo y el nombre del yacimiento en el indice espacial """
+
+	yacimiento = instance.id if sender is Yacimiento else instance.yacimiento_id
+	if sender is Datum or (sender is Coordenadas and signal is post_save):
+		datum.normalizar_coordenadas(Coordenadas.objects.filter(yacimiento=yacimiento))
+	indice.actualizar(yacimiento)
+
+@receiver(post_save, sender=Yacimiento)
+@receiver(post_delete, sender=Yacimiento)
+@receiver(post_save, sender=Piedra)
+@receiver(post_delete, sender=Piedra)
+def actualizar_autocompletado(sender, instance, signal, **kwargs):
+	""" Actualiza los nombres y codigos que sugiere el autocompletado """
+
+	autocompletar.actualizar(instance, borrada = signal is post_delete)
+
+@receiver(post_save, sender=Estado)
+@receiver(post_delete, sender=Estado)
+@receiver(post_save, sender=Municipio)
+@receiver(post_delete, sender=Municipio)
+def actualizar_municipios(sender, instance, **kwargs):
+	""" Invalida la tabla de municipios por estado de todos los procesos """
+
+	municipios.invalidar()
@@ -60,3 +60,264 @@
 }(Suit.$));
 
 
+/**
+* Carga de inlines por pestaa
+* El formulario de modificacin trae solo los inlines de la pestaa inicial. Al abrir
+* otra pestaa por primera vez se piden sus inlines a <id>/pestana/<nombre>/ y al guardar
+* se envan en el campo pestanas las pestaas cargadas, para que solo se procesen esas.
+****/
+(function ($){
+
+	$(function () {
+
+		var $tabs = $('#suit_form_tabs');
+		if ($tabs.length == 0) {
+			return;
+		}
+
+		var $form = $tabs.closest('form');
+		var base = window.location.pathname.replace(/\/$/, '');
+
+		//Pestaa de un enlace: '#generales' -> 'generales'
+		function pestana($link) {
+			return $link.attr('href').replace('#', '');
+		}
+
+		//Se consideran cargadas las pestaas cuyos inlines ya estn en la pgina. Una
+		//pestaa puede tener adems fieldsets del formulario principal, que no cuentan
+		function cargada(nombre) {
+			return $('.inline-group.suit-tab-' + nombre).length != 0;
+		}
+
+		var cargadas = {};
+		$tabs.find('a').each(function () {
+			var nombre = pestana($(this));
+			if (cargada(nombre)) {
+				cargadas[nombre] = true;
+			}
+		});
+
+		$tabs.find('a').click(function () {
+			var $link = $(this);
+			var nombre = pestana($link);
+			if (cargadas[nombre] !== undefined) {
+				return;
+			}
+
+			cargadas[nombre] = false;
+			$.get(base + '/pestana/' + nombre + '/', function (html) {
+				$form.find('.tab-content-main').append(html);
+				cargadas[nombre] = true;
+				//Si el usuario ya cambi de pestaa, el contenido queda oculto
+				var activa = $link.parent().hasClass('active');
+				$('.suit-tab-' + nombre).removeClass('show hide').addClass(activa ? 'show' : 'hide');
+			}).fail(function () {
+				delete cargadas[nombre];
+			});
+		});
+
+		$form.submit(function () {
+			$form.find('input[name=pestanas]').remove();
+			$.each(cargadas, function (nombre, lista) {
+				if (lista) {
+					$form.append($('<input type="hidden" name="pestanas" />').val(nombre));
+				}
+			});
+		});
+	});
+}(Suit.$));
+
+
+/**
+* Guardado por seccin
+* En el formulario de modificacin cada inline tiene un botn que guarda solo esa
+* seccin en <id>/seccion/<prefijo>/ junto con la versin que tena al cargarse. Si otra
+* persona la cambi mientras tanto el servidor responde 409 y no se guarda. El botn
+* Guardar del formulario enva las mismas versiones en el campo versiones.
+****/
+(function ($){
+
+	$(function () {
+
+		var $form = $('#suit_form_tabs').closest('form');
+		if ($form.length == 0 || $('.versiones-seccion').length == 0) {
+			return;
+		}
+
+		var base = window.location.pathname.replace(/\/$/, '');
+		var versiones = {};
+
+		//Versiones enviadas por el servidor con la pgina y con cada pestaa cargada
+		function leerVersiones() {
+			$('.versiones-seccion').each(function () {
+				$.extend(versiones, $(this).data('versiones'));
+			}).remove();
+		}
+
+		function datosSeccion($grupo, prefijo) {
+			var datos = new FormData();
+			datos.append('csrfmiddlewaretoken', $form.find('input[name=csrfmiddlewaretoken]').val());
+			datos.append('version', versiones[prefijo] || 0);
+			$grupo.find(':input[name]').each(function () {
+				var campo = this;
+				if (campo.type == 'file') {
+					if (campo.files && campo.files.length) {
+						datos.append(campo.name, campo.files[0]);
+					}
+				} else if (campo.type == 'checkbox' || campo.type == 'radio') {
+					if (campo.checked) {
+						datos.append(campo.name, campo.value);
+					}
+				} else if (campo.type == 'select-multiple') {
+					$.each($(campo).val() || [], function (i, valor) {
+						datos.append(campo.name, valor);
+					});
+				} else if (campo.type != 'button' && campo.type != 'submit') {
+					datos.append(campo.name, $(campo).val());
+				}
+			});
+			return datos;
+		}
+
+		function errores(respuesta) {
+			var mensajes = [].concat(respuesta.generales || []);
+			$.each(respuesta.errores || [], function (i, errores) {
+				$.each(errores, function (campo, lista) {
+					mensajes.push((i + 1) + '. ' + campo + ': ' + lista.join(' '));
+				});
+			});
+			return mensajes.join(' | ');
+		}
+
+		function guardarSeccion($grupo) {
+			var prefijo = $grupo.attr('id').replace(/-group$/, '');
+			var $estado = $grupo.find('.estado-seccion').text('Guardando...');
+
+			$.ajax({
+				url: base + '/seccion/' + prefijo + '/',
+				type: 'POST',
+				data: datosSeccion($grupo, prefijo),
+				processData: false,
+				contentType: false,
+				dataType: 'json'
+			}).done(function (respuesta) {
+				versiones[prefijo] = respuesta.version;
+				$grupo.replaceWith(respuesta.html);
+				var $nuevo = $('#' + prefijo + '-group').removeClass('hide').addClass('show');
+				agregarBotones($nuevo);
+				$nuevo.find('.estado-seccion').text('Seccin guardada.');
+			}).fail(function (xhr) {
+				if (xhr.status == 409) {
+					$estado.text('Otra persona modific esta seccin. Recargue la pgina antes de guardarla.');
+				} else if (xhr.status == 400) {
+					$estado.text('Corrija los errores: ' + errores($.parseJSON(xhr.responseText)));
+				} else {
+					$estado.text('No se pudo guardar la seccin.');
+				}
+			});
+		}
+
+		function agregarBotones($grupos) {
+			$grupos.filter('.inline-group').not(':has(.guardar-seccion)').each(function () {
+				var $grupo = $(this);
+				$('<div class="guardar-seccion">' +
+					'<input type="button" class="btn btn-info" value="Guardar seccin" /> ' +
+					'<span class="estado-seccion"></span></div>')
+					.appendTo($grupo)
+					.find('input').click(function () {
+						guardarSeccion($grupo);
+					});
+			});
+		}
+
+		//El formulario completo tambin enva las versiones, para que el servidor
+		//rechace las secciones que otra persona cambi mientras tanto
+		$form.submit(function () {
+			$form.find('input[name=versiones]').remove();
+			$form.append($('<input type="hidden" name="versiones" />').val(JSON.stringify(versiones)));
+		});
+
+		leerVersiones();
+		agregarBotones($('.inline-group'));
+
+		//Los inlines de las pestaas que se cargan despus
+		$(document).ajaxComplete(function () {
+			leerVersiones();
+			agregarBotones($('.inline-group'));
+		});
+	});
+}(Suit.$));
+
+
+/**
+* Sugerencias en la bsqueda de los listados
+* El cuadro de bsqueda de los listados de yacimientos y piedras sugiere nombres y
+* cdigos mientras se escribe, con el autocompletado en memoria de /autocompletar.
+****/
+(function ($){
+
+	$(function () {
+
+		var $buscador = $('body.change-list #searchbar');
+		var modelo = window.location.pathname.match(/\/anarapp\/(yacimiento|piedra)\/?$/);
+		if ($buscador.length == 0 || !modelo) {
+			return;
+		}
+
+		var $lista = $('<datalist id="sugerencias-busqueda"></datalist>').insertAfter($buscador);
+		$buscador.attr({list: 'sugerencias-busqueda', autocomplete: 'off'});
+
+		var pedido = null;
+		$buscador.on('input', function () {
+			if (pedido) {
+				pedido.abort();
+			}
+			pedido = $.getJSON('/autocompletar', {q: $buscador.val(), tipo: modelo[1]}, function (datos) {
+				$lista.empty();
+				$.each(datos, function (i, sugerencia) {
+					$lista.append($('<option>').attr('value', sugerencia.texto));
+				});
+			});
+		});
+	});
+}(Suit.$));
+
+
+/**
+* Municipios por estado
+* El select de municipio trae en data-municipios la url de la tabla estado -> municipios.
+* Se pide una sola vez (el navegador la guarda con su ETag) y al cambiar el estado se
+* llenan los municipios sin volver a consultar el servidor.
+****/
+(function ($){
+
+	$(function () {
+
+		$('select[data-municipios]').each(function () {
+			var $municipio = $(this);
+			var $estado = $('#id_' + $municipio.data('estado'));
+			var vacio = $municipio.find('option[value=""]').text() || '---------';
+			var tabla = null;
+
+			function llenar() {
+				var actual = $municipio.val();
+				var opciones = tabla[$estado.val()] || [];
+				$municipio.empty().append($('<option value="">').text(vacio));
+				$.each(opciones, function (i, municipio) {
+					$municipio.append($('<option>').attr('value', municipio[0]).text(municipio[1]));
+				});
+				$municipio.val(actual);
+				//Con un solo municipio se elige de una vez
+				if (opciones.length == 1) {
+					$municipio.val(opciones[0][0]);
+				}
+				$municipio.trigger('change');
+			}
+
+			$.ajax({url: $municipio.data('municipios'), dataType: 'json', cache: true}).done(function (datos) {
+				tabla = datos;
+				$estado.change(llenar);
+			});
+		});
+	});
+}(Suit.$));
@@ -60,7 +60,7 @@ def yacimiento(i, inserts):
 				if 'yacimiento' in obj.__dict__ and name != 'Piedra':
 				
 					for field in obj._meta.fields:
-						if field.name == 'id':
+						if field.name == 'id' or not field.editable:
 							continue
 
 						atype = field.get_internal_type()
@@ -111,7 +111,7 @@ def piedra(i, inserts):
 				if 'piedra' in obj.__dict__:
 				
 					for field in obj._meta.fields:
-						if field.name == 'id':
+						if field.name == 'id' or not field.editable:
 							continue
 
 						atype = field.get_internal_type()
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+########################################################################################
+# Normalizacion de textos
+# Los nombres de estados, municipios y yacimientos se escriben con y sin acentos y en
+# mayusculas o minusculas ('BOLÍVAR', 'Bolivar'). Estas funciones los llevan a una
+# forma comun para compararlos.
+########################################################################################
+
+import re
+import unicodedata
+
+def clave(texto):
+	""" Normaliza un texto para comparar sin importar mayusculas ni acentos """
+
+	if texto is None:
+		return u''
+	if isinstance(texto, str):
+		texto = texto.decode('utf-8')
+	texto = unicodedata.normalize('NFKD', texto)
+	return u''.join(c for c in texto if not unicodedata.combining(c)).lower()
+
+PALABRA = re.compile(r'\w+', re.UNICODE)
+
+def clave_exacta(texto):
+	""" Valor de los campos clave del indice: el texto normalizado como una sola
+	palabra ('Delta Amacuro' -> 'delta_amacuro'), para filtrar por igualdad """
+
+	return u'_'.join(PALABRA.findall(clave(texto)))
+
+# Palabras que no se indexan en los campos de texto
+PALABRAS_VACIAS = frozenset(u'''a al como con de del e el en entre es la las lo los o para
+	por que se sin su sus u un una uno unos unas y'''.split())
+
+def raiz(palabra):
+	""" Raiz aproximada de una palabra en español, ya normalizada con clave(): quita
+	el plural y la vocal final de genero ('piedras', 'pintadas', 'pintado' -> 'piedr',
+	'pintad'). Es un stemmer liviano, suficiente para nombres y descripciones cortas """
+
+	if len(palabra) > 4 and palabra.endswith(u'ces'):
+		palabra = palabra[:-3] + u'z'
+	elif len(palabra) > 4 and palabra.endswith(u'es') and palabra[-3] in u'bdjlnrsyz':
+		palabra = palabra[:-2]
+	elif len(palabra) > 3 and palabra.endswith(u's'):
+		palabra = palabra[:-1]
+
+	if len(palabra) > 4 and palabra[-1] in u'aeo':
+		palabra = palabra[:-1]
+	return palabra
@@ -22,7 +22,7 @@ urlpatterns = patterns('',
 	url(r'^quienes/', TemplateView.as_view(template_name="anarapp/quienes.html"),
 	),
 
-	url(r'^results/', SearchView(
+	url(r'^results/', views.ResultadosView(
         template='anarapp/results.html',
         searchqueryset=SearchQuerySet(),
         form_class=AdvancedForm,
@@ -48,5 +48,9 @@ urlpatterns = patterns('',
 
      url(r'^patrimonio$', views.patrimonio),
 
+     url(r'^autocompletar$', views.autocompletar, name='autocompletar'),
+
+     url(r'^municipios\.json$', views.municipios, name='municipios'),
+
 
 )
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+########################################################################################
+# Version de los datos
+# Contador guardado en la cache que cambia cada vez que se modifica una ficha. Forma
+# parte de las claves de los resultados cacheados, asi un cambio los invalida a todos.
+########################################################################################
+
+import time
+
+from django.core.cache import cache
+
+CLAVE_VERSION = 'anar:version_datos'
+
+# Version propia de las coordenadas, para no reconstruir el indice espacial
+# cada vez que cambia cualquier otra parte de la ficha
+CLAVE_COORDENADAS = 'anar:version_coordenadas'
+
+# Version de los nombres y codigos que ofrece el autocompletado
+CLAVE_NOMBRES = 'anar:version_nombres'
+
+# Version de la tabla de municipios por estado
+CLAVE_MUNICIPIOS = 'anar:version_municipios'
+
+# La version no debe expirar junto con los resultados que dependen de ella
+DURACION_VERSION = 60 * 60 * 24 * 365
+
+def version_datos(clave=CLAVE_VERSION):
+	""" Retorna la version actual de los datos """
+
+	version = cache.get(clave)
+	if version is None:
+		# Si la cache perdio el contador se arranca de un valor nuevo, para no
+		# reutilizar resultados guardados con una version anterior
+		version = int(time.time())
+		cache.set(clave, version, DURACION_VERSION)
+	return version
+
+def nueva_version(clave=CLAVE_VERSION):
+	""" Incrementa la version de los datos y retorna la nueva """
+
+	try:
+		return cache.incr(clave)
+	except ValueError:
+		return version_datos(clave)
@@ -1,10 +1,26 @@
 #coding: latin-1
 
+import json
+
 from anarapp.models import Yacimiento, Piedra
 from django.http import HttpResponse
-from django.shortcuts import render
+from django.shortcuts import render, get_object_or_404
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
 from haystack.views import SearchView
 from anarapp.forms import PiedraForm
+from anarapp.prefetch import ficha_completa
+from geoespacial.indice import indice
+from anarapp.autocompletar import autocompletado, SUGERENCIAS, MAXIMO_SUGERENCIAS
+from anarapp.facetas import facetas, sin_paginacion
+from anarapp.paginacion import pagina_por_clave, pagina_por_puntaje
+from anarapp import municipios as tabla_municipios
+
+# Cantidad de yacimientos cercanos que se muestran en la ficha
+CERCANOS = 5
+
+# Tiempo que el navegador usa la tabla de municipios sin volver a validarla
+DURACION_MUNICIPIOS = 60 * 60 * 24
 
 # Create your views here.
 
@@ -18,16 +34,23 @@ def patrimonio(request):
     return render(request, 'informacion/patrimonio.html')
 
 def yacimiento(request, pk):
-    yacimiento = Yacimiento.objects.get(codigo = pk)
-    piedras = Piedra.objects.filter(yacimiento = yacimiento.id)
-    print "HOLAAA"
+    yacimiento = get_object_or_404(ficha_completa(), codigo = pk)
+    #Las piedras vienen precargadas junto con el resto de la ficha
+    piedras = yacimiento.Yacimiento.all()
+    
+    #Yacimientos mas cercanos segun el indice espacial
+    cercanos = []
+    coordenadas = yacimiento.Coordenadas
+    if coordenadas is not None and coordenadas.latitudWgs84 is not None and coordenadas.longitudWgs84 is not None:
+        cercanos = indice().vecinos(coordenadas.latitudWgs84, coordenadas.longitudWgs84, CERCANOS, excluir = yacimiento.id)
     
     form = PiedraForm()
     
     return render(request, 'anarapp/detail.html', {
         'yacimiento' : yacimiento,
         'form' : form,
-        'piedras' : piedras
+        'piedras' : piedras,
+        'cercanos' : cercanos
     })
 
 def piedra(request, pk):
@@ -39,3 +62,51 @@ def piedra(request, pk):
         'form' : form
     })
 
+class ResultadosView(SearchView):
+    """ Resultados de la busqueda con los conteos por estado, tipo, manifestacion,
+    material y conservacion de los yacimientos encontrados. Con texto en q se ordenan
+    por relevancia; sin texto, por codigo """
+
+    def build_page(self):
+        # Sin texto, paginacion por clave: cada pagina continua desde el ultimo codigo
+        # mostrado. Con texto se conserva el orden por relevancia y se pagina por posicion
+        paginar = pagina_por_puntaje if self.query else pagina_por_clave
+        self.pagina = paginar(self.results, self.results_per_page,
+            self.request.GET.get('despues'), self.request.GET.get('antes'))
+        self.pagina.enlace_anterior = self.enlace('antes', self.pagina.anterior)
+        self.pagina.enlace_siguiente = self.enlace('despues', self.pagina.siguiente)
+        return (self.pagina, self.pagina)
+
+    def enlace(self, parametro, token):
+        if token is None:
+            return None
+        consulta = sin_paginacion(self.request.GET)
+        consulta[parametro] = token
+        return '?' + consulta.urlencode()
+
+    def extra_context(self):
+        # La pagina ya trae el total de resultados, no se vuelve a contar
+        return {'facetas': facetas(self.results, self.pagina.count, self.request.GET)}
+
+def autocompletar(request):
+    """ Sugerencias de nombres y codigos de yacimientos, codigos de piedras y nombres
+    de figuras que empiezan con el texto q, solo de los tipos dados en tipo si se
+    indican. Se responden desde memoria, sin usar el indice """
+
+    try:
+        cantidad = min(int(request.GET.get('n', SUGERENCIAS)), MAXIMO_SUGERENCIAS)
+    except ValueError:
+        cantidad = SUGERENCIAS
+
+    sugerencias = autocompletado().buscar(request.GET.get('q', ''), cantidad, request.GET.getlist('tipo'))
+    datos = [{'texto': texto, 'tipo': tipo, 'codigo': codigo} for texto, tipo, codigo in sugerencias]
+    return HttpResponse(json.dumps(datos), content_type='application/json')
+
+@condition(etag_func=lambda request: tabla_municipios.tabla().etag)
+def municipios(request):
+    """ Municipios de cada estado en un solo JSON cacheable. El ETag solo cambia
+    cuando cambian los estados o municipios """
+
+    response = HttpResponse(tabla_municipios.tabla().contenido, content_type='application/json')
+    patch_cache_control(response, public=True, max_age=DURACION_MUNICIPIOS)
+    return response
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+########################################################################################
+# Backend de Whoosh con analizador para textos en español
+# Los campos de texto del indice se analizan sin acentos, en minusculas y con la raiz
+# de cada palabra (anarapp.texto.raiz), tanto al indexar como al buscar. Los campos
+# clave (ClaveField en search_indexes) se guardan como un solo termino para filtrar
+# por igualdad. Se activa con el ENGINE 'anarapp.whoosh_backend.AnarWhooshEngine'.
+########################################################################################
+
+from haystack.backends.whoosh_backend import WhooshEngine, WhooshSearchBackend
+from whoosh.analysis import RegexTokenizer, LowercaseFilter, CharsetFilter, StopFilter, StemFilter
+from whoosh.fields import ID, TEXT
+from whoosh.support.charset import accent_map
+
+from anarapp.texto import PALABRAS_VACIAS, raiz
+
+def analizador():
+	return RegexTokenizer() | LowercaseFilter() | CharsetFilter(accent_map) | \
+		StopFilter(stoplist=PALABRAS_VACIAS, minsize=1) | StemFilter(stemfn=raiz)
+
+class AnarWhooshSearchBackend(WhooshSearchBackend):
+
+	def build_schema(self, fields):
+		content_field_name, schema = super(AnarWhooshSearchBackend, self).build_schema(fields)
+
+		for field_name, field_class in fields.items():
+			nombre = field_class.index_fieldname
+			if field_class.field_type == 'clave':
+				schema.remove(nombre)
+				schema.add(nombre, ID(stored=True))
+			elif isinstance(schema[nombre], TEXT):
+				schema.remove(nombre)
+				schema.add(nombre, TEXT(stored=True, analyzer=analizador(), field_boost=field_class.boost))
+
+		return (content_field_name, schema)
+
+class AnarWhooshEngine(WhooshEngine):
+	backend = AnarWhooshSearchBackend
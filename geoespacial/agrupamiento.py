@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+########################################################################################
+# Agrupamiento de marcadores del mapa
+# Los puntos se reparten en una malla cuyo tamaño depende del zoom; cada celda con
+# mas de un yacimiento se envia como un solo marcador con el total.
+# El reparto se hace en la base de datos con GROUP BY sobre la celda de cada posicion
+# WGS 84; solo se traen los yacimientos de las celdas que tienen uno.
+########################################################################################
+
+from django.db import connection
+from django.db.models import Avg, Count, Min
+from django.utils.datastructures import SortedDict
+
+# Desde este zoom se envian los yacimientos individuales
+ZOOM_SITIOS = 12
+
+# Lado aproximado de cada celda, en pixeles de pantalla
+PIXELES_CELDA = 60
+
+def tamano_celda(zoom):
+	""" Lado de la celda en grados para el zoom dado (teselas de 256 pixeles) """
+
+	return 360.0 / (256 * 2 ** zoom) * PIXELES_CELDA
+
+def puntos(coordenadas):
+	""" Lista de (latitud, longitud, codigo, nombre) de las coordenadas dadas """
+
+	return list(coordenadas.values_list('latitudWgs84', 'longitudWgs84', 'yacimiento__codigo', 'yacimiento__nombre'))
+
+def agrupar(coordenadas, zoom):
+	""" Agrupa por celda las coordenadas (consulta sobre Coordenadas). Retorna la lista
+	de grupos, cada uno con su centro y total, y la lista de puntos sueltos """
+
+	if zoom >= ZOOM_SITIOS:
+		return [], puntos(coordenadas)
+
+	lado = tamano_celda(zoom)
+	tabla = connection.ops.quote_name(coordenadas.model._meta.db_table)
+	celda = SortedDict([
+		('fila', 'floor(%s.%s / %%s)' % (tabla, connection.ops.quote_name('latitudWgs84'))),
+		('columna', 'floor(%s.%s / %%s)' % (tabla, connection.ops.quote_name('longitudWgs84'))),
+	])
+	celdas = coordenadas.extra(select=celda, select_params=(lado, lado)).order_by() \
+		.values('fila', 'columna').annotate(total=Count('id'), latitud=Avg('latitudWgs84'),
+			longitud=Avg('longitudWgs84'), primera=Min('id'))
+
+	grupos, solas = [], []
+	for fila in celdas:
+		if fila['total'] == 1:
+			solas.append(fila['primera'])
+			continue
+
+		grupos.append({
+			'latitud': fila['latitud'],
+			'longitud': fila['longitud'],
+			'total': fila['total'],
+		})
+
+	sueltos = puntos(coordenadas.model.objects.filter(id__in=solas)) if solas else []
+	return grupos, sueltos
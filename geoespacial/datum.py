@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+########################################################################################
+# Conversion de datum
+# Lleva lotes de coordenadas en La Canoa - Provisional Suramericano 1956 (PSAD56) o
+# en UTM a latitud y longitud WGS 84. Las funciones reciben y retornan listas para
+# convertir muchos puntos de una vez con las constantes calculadas una sola vez.
+########################################################################################
+
+import math
+
+from anarapp.models import Coordenadas, Datum
+
+class Elipsoide(object):
+
+	def __init__(self, a, f):
+		self.a = a
+		self.f = f
+		self.e2 = f * (2 - f)
+		self.b = a * (1 - f)
+		self.ep2 = self.e2 / (1 - self.e2)
+
+WGS84 = Elipsoide(6378137.0, 1 / 298.257223563)
+
+# Elipsoide Internacional 1924, usado por PSAD56
+INTERNACIONAL = Elipsoide(6378388.0, 1 / 297.0)
+
+# Traslacion geocentrica PSAD56 -> WGS 84 para Venezuela (NIMA TR8350.2), en metros
+PSAD56_A_WGS84 = (-295.0, 173.0, -371.0)
+
+# Valores de Datum.tipoDatum
+DATUM_WGS84 = 1
+DATUM_PSAD56 = 2
+
+def _a_geocentricas(lats, lons, elipsoide):
+	xs, ys, zs = [], [], []
+	a, e2 = elipsoide.a, elipsoide.e2
+	for lat, lon in zip(lats, lons):
+		fi, la = math.radians(lat), math.radians(lon)
+		seno = math.sin(fi)
+		n = a / math.sqrt(1 - e2 * seno * seno)
+		xs.append(n * math.cos(fi) * math.cos(la))
+		ys.append(n * math.cos(fi) * math.sin(la))
+		zs.append(n * (1 - e2) * seno)
+	return xs, ys, zs
+
+def _a_geodesicas(xs, ys, zs, elipsoide):
+	lats, lons = [], []
+	a, b, e2, ep2 = elipsoide.a, elipsoide.b, elipsoide.e2, elipsoide.ep2
+	for x, y, z in zip(xs, ys, zs):
+		# Formula de Bowring, suficiente para puntos cerca de la superficie
+		p = math.hypot(x, y)
+		theta = math.atan2(z * a, p * b)
+		fi = math.atan2(z + ep2 * b * math.sin(theta) ** 3, p - e2 * a * math.cos(theta) ** 3)
+		lats.append(math.degrees(fi))
+		lons.append(math.degrees(math.atan2(y, x)))
+	return lats, lons
+
+def psad56_a_wgs84(lats, lons):
+	""" Convierte listas de latitudes y longitudes PSAD56 a WGS 84 """
+
+	xs, ys, zs = _a_geocentricas(lats, lons, INTERNACIONAL)
+	dx, dy, dz = PSAD56_A_WGS84
+	xs = [x + dx for x in xs]
+	ys = [y + dy for y in ys]
+	zs = [z + dz for z in zs]
+	return _a_geodesicas(xs, ys, zs, WGS84)
+
+def utm_a_geodesicas(zonas, bandas, estes, nortes, elipsoide=WGS84):
+	""" Convierte listas de coordenadas UTM a latitudes y longitudes sobre el elipsoide
+	dado (transversa de Mercator inversa, Snyder 1987). Sin banda se asume el
+	hemisferio norte """
+
+	k0 = 0.9996
+	a, e2, ep2 = elipsoide.a, elipsoide.e2, elipsoide.ep2
+	e1 = (1 - math.sqrt(1 - e2)) / (1 + math.sqrt(1 - e2))
+	m1 = a * (1 - e2 / 4 - 3 * e2 ** 2 / 64 - 5 * e2 ** 3 / 256)
+	c1 = 3 * e1 / 2 - 27 * e1 ** 3 / 32
+	c2 = 21 * e1 ** 2 / 16 - 55 * e1 ** 4 / 32
+	c3 = 151 * e1 ** 3 / 96
+	c4 = 1097 * e1 ** 4 / 512
+
+	lats, lons = [], []
+	for zona, banda, este, norte in zip(zonas, bandas, estes, nortes):
+		if banda and banda < 'N':
+			norte -= 10000000.0
+
+		mu = norte / k0 / m1
+		fi1 = mu + c1 * math.sin(2 * mu) + c2 * math.sin(4 * mu) + c3 * math.sin(6 * mu) + c4 * math.sin(8 * mu)
+
+		seno, coseno, tangente = math.sin(fi1), math.cos(fi1), math.tan(fi1)
+		n1 = a / math.sqrt(1 - e2 * seno ** 2)
+		t1 = tangente ** 2
+		cc = ep2 * coseno ** 2
+		r1 = a * (1 - e2) / (1 - e2 * seno ** 2) ** 1.5
+		d = (este - 500000.0) / (n1 * k0)
+
+		fi = fi1 - (n1 * tangente / r1) * (d ** 2 / 2
+			- (5 + 3 * t1 + 10 * cc - 4 * cc ** 2 - 9 * ep2) * d ** 4 / 24
+			+ (61 + 90 * t1 + 298 * cc + 45 * t1 ** 2 - 252 * ep2 - 3 * cc ** 2) * d ** 6 / 720)
+		la = (d - (1 + 2 * t1 + cc) * d ** 3 / 6
+			+ (5 - 2 * cc + 28 * t1 - 3 * cc ** 2 + 8 * ep2 + 24 * t1 ** 2) * d ** 5 / 120) / coseno
+
+		lats.append(math.degrees(fi))
+		lons.append((zona - 1) * 6 - 180 + 3 + math.degrees(la))
+	return lats, lons
+
+def normalizar(puntos):
+	""" Lleva a WGS 84 una lista de puntos. Cada punto es un diccionario con las claves
+	datum, latitud, longitud y utm (zona, banda, este, norte), donde latitud y longitud
+	o utm pueden ser None. Retorna la lista de (latitud, longitud) WGS 84, o None para
+	los puntos sin coordenadas. Los puntos se agrupan por datum y origen para
+	convertir cada grupo de una vez """
+
+	grupos = {}
+	for posicion, punto in enumerate(puntos):
+		origen = None
+		if punto['latitud'] is not None and punto['longitud'] is not None:
+			origen = 'geodesicas'
+		elif punto['utm'] is not None:
+			origen = 'utm'
+		if origen is not None:
+			psad56 = punto['datum'] == DATUM_PSAD56
+			grupos.setdefault((origen, psad56), []).append(posicion)
+
+	resultado = [None] * len(puntos)
+	for (origen, psad56), posiciones in grupos.items():
+		if origen == 'geodesicas':
+			lats = [puntos[i]['latitud'] for i in posiciones]
+			lons = [puntos[i]['longitud'] for i in posiciones]
+		else:
+			utms = [puntos[i]['utm'] for i in posiciones]
+			lats, lons = utm_a_geodesicas(*zip(*utms), elipsoide=INTERNACIONAL if psad56 else WGS84)
+
+		if psad56:
+			lats, lons = psad56_a_wgs84(lats, lons)
+
+		for i, lat, lon in zip(posiciones, lats, lons):
+			resultado[i] = (lat, lon)
+
+	return resultado
+
+def normalizar_coordenadas(qs):
+	""" Calcula y guarda longitudWgs84 y latitudWgs84 de las coordenadas del queryset
+	con dos consultas de lectura y un update() por fila, sin disparar señales.
+	Retorna la cantidad de filas procesadas """
+
+	filas = list(qs.values_list('id', 'yacimiento_id', 'latitudNum', 'longitudNum',
+		'utmZona', 'utmBanda', 'utmEste', 'utmNorte'))
+	datums = dict(Datum.objects.filter(yacimiento__in=[fila[1] for fila in filas])
+		.values_list('yacimiento_id', 'tipoDatum'))
+
+	puntos = []
+	for pk, yacimiento, lat, lon, zona, banda, este, norte in filas:
+		utm = None if None in (zona, este, norte) else (zona, banda, este, norte)
+		puntos.append({'datum': datums.get(yacimiento), 'latitud': lat, 'longitud': lon, 'utm': utm})
+
+	for fila, wgs84 in zip(filas, normalizar(puntos)):
+		lat, lon = wgs84 or (None, None)
+		Coordenadas.objects.filter(pk=fila[0]).update(latitudWgs84=lat, longitudWgs84=lon)
+
+	return len(filas)
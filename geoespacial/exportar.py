@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+########################################################################################
+# Exportacion de la capa de yacimientos
+# Genera GeoJSON y KML fila por fila leyendo con un cursor del lado del servidor, de
+# modo que exportar todo el archivo use memoria constante y empiece a enviar enseguida.
+########################################################################################
+
+import json
+import uuid
+from xml.sax.saxutils import escape
+
+from django.db import connections
+from django.db.models.sql.datastructures import EmptyResultSet
+
+from anarapp.codigos import mascara
+from anarapp.models import Coordenadas, Estado, Municipio, ResumenYacimiento
+from anarapp.texto import clave
+
+# Filas que se traen de la base de datos en cada viaje
+LOTE = 500
+
+COLUMNAS = ('yacimiento__codigo', 'yacimiento__nombre', 'yacimiento__estado__nombre',
+	'yacimiento__municipio__nombre', 'latitudWgs84', 'longitudWgs84')
+
+def con_nombre(modelo, nombre):
+	""" Ids de las filas de modelo (Estado o Municipio) cuyo nombre es igual al dado
+	sin importar mayusculas ni acentos, como en la busqueda y las facetas. Las tablas
+	son pequeñas y se comparan en Python con texto.clave """
+
+	buscado = clave(nombre).strip()
+	return [pk for pk, valor in modelo.objects.values_list('id', 'nombre') if clave(valor).strip() == buscado]
+
+def consulta(estado=None, municipio=None, manifestaciones=None):
+	""" Retorna el queryset de filas a exportar, con los filtros opcionales por nombre
+	de estado y municipio y por codigos de manifestacion (anarapp.codigos) """
+
+	qs = Coordenadas.objects.filter(latitudWgs84__isnull=False, longitudWgs84__isnull=False)
+	if estado:
+		qs = qs.filter(yacimiento__estado__in=con_nombre(Estado, estado))
+	if municipio:
+		qs = qs.filter(yacimiento__municipio__in=con_nombre(Municipio, municipio))
+	if manifestaciones:
+		# Se une el resumen en la misma consulta; en una subconsulta Django renombra la
+		# tabla y la condicion sobre la mascara dejaria de encontrarla
+		qn = connections[qs.db].ops.quote_name
+		columna = '%s.%s' % (qn(ResumenYacimiento._meta.db_table), qn('mascara_manifestacion'))
+		qs = qs.filter(yacimiento__ResumenYacimiento__isnull=False) \
+			.extra(where=['(%s & %%s) <> 0' % columna], params=[mascara(manifestaciones)])
+	return qs.order_by('yacimiento__codigo').values_list(*COLUMNAS)
+
+def filas(qs, lote=LOTE):
+	""" Recorre el queryset con un cursor con nombre de psycopg2, que deja el resultado
+	en el servidor y lo trae de a lote filas """
+
+	try:
+		sql, params = qs.query.sql_with_params()
+	except EmptyResultSet:
+		# Un filtro por nombre que no coincide con ningun estado o municipio
+		return
+
+	connection = connections[qs.db]
+	connection.cursor()  # abre la conexion si todavia no existe
+
+	cursor = connection.connection.cursor(name='exportar_%s' % uuid.uuid4().hex)
+	try:
+		cursor.execute(sql, params)
+		while True:
+			bloque = cursor.fetchmany(lote)
+			if not bloque:
+				break
+			for fila in bloque:
+				yield fila
+	finally:
+		cursor.close()
+
+def _propiedades(fila):
+	codigo, nombre, estado, municipio = fila[:4]
+	return {'codigo': codigo, 'nombre': nombre, 'estado': estado, 'municipio': municipio}
+
+def geojson(filas):
+	""" Genera una FeatureCollection GeoJSON por partes """
+
+	yield '{"type": "FeatureCollection", "features": [\n'
+	separador = ''
+	for fila in filas:
+		elemento = {
+			'type': 'Feature',
+			'geometry': {'type': 'Point', 'coordinates': [fila[5], fila[4]]},
+			'properties': _propiedades(fila),
+		}
+		yield separador + json.dumps(elemento)
+		separador = ',\n'
+	yield '\n]}\n'
+
+def kml(filas):
+	""" Genera un documento KML por partes, un Placemark por yacimiento """
+
+	yield '<?xml version="1.0" encoding="UTF-8"?>\n' \
+		'<kml xmlns="http://www.opengis.net/kml/2.2"><Document>\n<name>Yacimientos</name>\n'
+	for fila in filas:
+		propiedades = _propiedades(fila)
+		datos = ''.join('<Data name="%s"><value>%s</value></Data>' % (campo, escape(propiedades[campo] or u''))
+			for campo in ('codigo', 'estado', 'municipio'))
+		placemark = u'<Placemark><name>%s</name><ExtendedData>%s</ExtendedData>' \
+			u'<Point><coordinates>%r,%r</coordinates></Point></Placemark>\n' % \
+			(escape(propiedades['nombre'] or propiedades['codigo']), datos, fila[5], fila[4])
+		yield placemark.encode('utf-8')
+	yield '</Document></kml>\n'
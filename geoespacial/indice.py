@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+
+########################################################################################
+# Indice espacial de yacimientos
+# Malla de celdas de tamaño fijo construida en memoria a partir de las posiciones WGS 84
+# de Coordenadas. Sirve
+# para buscar los yacimientos dentro de un radio y los k mas cercanos sin PostGIS.
+########################################################################################
+
+import heapq
+import math
+
+from anarapp.models import Coordenadas
+from anarapp.versiones import version_datos, nueva_version, CLAVE_COORDENADAS
+
+# Lado de cada celda en grados (unos 11 km en el ecuador)
+LADO_CELDA = 0.1
+
+RADIO_TIERRA = 6371.0
+KM_POR_GRADO = math.pi * RADIO_TIERRA / 180
+
+# Mayor radio de busqueda que acepta el formulario, en km
+RADIO_MAXIMO = 500
+
+def distancia(lat1, lon1, lat2, lon2):
+	""" Distancia en km entre dos puntos, por la formula del haversine """
+
+	dlat = math.radians(lat2 - lat1)
+	dlon = math.radians(lon2 - lon1)
+	a = math.sin(dlat / 2) ** 2 + \
+		math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2
+	return 2 * RADIO_TIERRA * math.asin(min(1, math.sqrt(a)))
+
+def celda(lat, lon):
+	return int(math.floor(lat / LADO_CELDA)), int(math.floor(lon / LADO_CELDA))
+
+class Sitio(object):
+
+	""" Yacimiento ubicado en el indice """
+
+	__slots__ = ('yacimiento', 'codigo', 'nombre', 'latitud', 'longitud')
+
+	def __init__(self, yacimiento, codigo, nombre, latitud, longitud):
+		self.yacimiento = yacimiento
+		self.codigo = codigo
+		self.nombre = nombre
+		self.latitud = latitud
+		self.longitud = longitud
+
+class IndiceEspacial(object):
+
+	""" Malla de celdas -> sitios. Se puede construir completa o modificar un sitio a
+	la vez cuando se guardan sus coordenadas """
+
+	def __init__(self):
+		self.celdas = {}
+		self.sitios = {}
+		self.version = None
+
+	def agregar(self, sitio):
+		self.quitar(sitio.yacimiento)
+		self.sitios[sitio.yacimiento] = sitio
+		self.celdas.setdefault(celda(sitio.latitud, sitio.longitud), []).append(sitio)
+
+	def quitar(self, yacimiento):
+		sitio = self.sitios.pop(yacimiento, None)
+		if sitio is None:
+			return
+
+		clave = celda(sitio.latitud, sitio.longitud)
+		self.celdas[clave].remove(sitio)
+		if not self.celdas[clave]:
+			del self.celdas[clave]
+
+	def construir(self, filas):
+		""" Reemplaza el contenido por las filas (yacimiento, codigo, nombre, latitud, longitud) """
+
+		self.celdas = {}
+		self.sitios = {}
+		for fila in filas:
+			self.agregar(Sitio(*fila))
+
+	def en_radio(self, lat, lon, radio):
+		""" Retorna la lista de (distancia, sitio) a menos de radio km del punto,
+		ordenada por distancia """
+
+		dlat = radio / KM_POR_GRADO
+		dlon = radio / (KM_POR_GRADO * max(math.cos(math.radians(min(89.0, abs(lat) + dlat))), 0.01))
+
+		if not self.celdas:
+			return []
+
+		# El recuadro no pasa de las celdas ocupadas, por grande que sea el radio
+		filas = [clave[0] for clave in self.celdas]
+		columnas = [clave[1] for clave in self.celdas]
+		fila_min, columna_min = celda(lat - dlat, lon - dlon)
+		fila_max, columna_max = celda(lat + dlat, lon + dlon)
+		fila_min, fila_max = max(fila_min, min(filas)), min(fila_max, max(filas))
+		columna_min, columna_max = max(columna_min, min(columnas)), min(columna_max, max(columnas))
+
+		if (fila_max - fila_min + 1) * (columna_max - columna_min + 1) > len(self.celdas):
+			# Hay menos celdas ocupadas que celdas en el recuadro: se recorren esas
+			claves = [(fila, columna) for fila, columna in self.celdas
+				if fila_min <= fila <= fila_max and columna_min <= columna <= columna_max]
+		else:
+			claves = [(fila, columna) for fila in range(fila_min, fila_max + 1)
+				for columna in range(columna_min, columna_max + 1)]
+
+		encontrados = []
+		for clave in claves:
+			for sitio in self.celdas.get(clave, ()):
+				d = distancia(lat, lon, sitio.latitud, sitio.longitud)
+				if d <= radio:
+					encontrados.append((d, sitio))
+
+		encontrados.sort(key=lambda par: par[0])
+		return encontrados
+
+	def vecinos(self, lat, lon, k, excluir=None):
+		""" Retorna los k sitios mas cercanos al punto como lista de (distancia, sitio).
+		Recorre anillos de celdas cada vez mas grandes hasta que ningun sitio de un
+		anillo sin revisar pueda estar mas cerca que el k-esimo encontrado """
+
+		if not self.celdas or k <= 0:
+			return []
+
+		centro = celda(lat, lon)
+		filas = [clave[0] for clave in self.celdas]
+		columnas = [clave[1] for clave in self.celdas]
+		maximo = max(abs(centro[0] - min(filas)), abs(centro[0] - max(filas)),
+			abs(centro[1] - min(columnas)), abs(centro[1] - max(columnas)))
+
+		mejores = []
+		for anillo in range(maximo + 1):
+			for clave in self._anillo(centro, anillo):
+				for sitio in self.celdas.get(clave, ()):
+					if sitio.yacimiento == excluir:
+						continue
+					d = distancia(lat, lon, sitio.latitud, sitio.longitud)
+					if len(mejores) < k:
+						heapq.heappush(mejores, (-d, sitio))
+					elif d < -mejores[0][0]:
+						heapq.heapreplace(mejores, (-d, sitio))
+
+			# Lo que queda fuera de este anillo esta al menos a esta distancia
+			limite = anillo * LADO_CELDA * KM_POR_GRADO * math.cos(math.radians(min(89.0, abs(lat) + (anillo + 1) * LADO_CELDA)))
+			if len(mejores) == k and -mejores[0][0] <= limite:
+				break
+
+		return sorted(((-d, sitio) for d, sitio in mejores), key=lambda par: par[0])
+
+	def _anillo(self, centro, anillo):
+		if anillo == 0:
+			yield centro
+			return
+
+		fila, columna = centro
+		for c in range(columna - anillo, columna + anillo + 1):
+			yield (fila - anillo, c)
+			yield (fila + anillo, c)
+		for f in range(fila - anillo + 1, fila + anillo):
+			yield (f, columna - anillo)
+			yield (f, columna + anillo)
+
+_indice = IndiceEspacial()
+
+def filas_coordenadas(qs=None):
+	""" Retorna las filas (yacimiento, codigo, nombre, latitud, longitud) de los
+	yacimientos con coordenadas validas """
+
+	if qs is None:
+		qs = Coordenadas.objects.all()
+	qs = qs.filter(latitudWgs84__isnull=False, longitudWgs84__isnull=False)
+	return qs.values_list('yacimiento_id', 'yacimiento__codigo', 'yacimiento__nombre', 'latitudWgs84', 'longitudWgs84')
+
+def indice():
+	""" Retorna el indice espacial del proceso, reconstruyendolo si otro proceso
+	modifico las coordenadas desde la ultima vez """
+
+	version = version_datos(CLAVE_COORDENADAS)
+	if _indice.version != version:
+		_indice.construir(filas_coordenadas())
+		_indice.version = version
+	return _indice
+
+def actualizar(yacimiento):
+	""" Actualiza en el indice solo el yacimiento dado, luego de guardar o borrar sus
+	coordenadas. Los demas procesos lo reconstruyen al ver la nueva version """
+
+	vigente = _indice.version == version_datos(CLAVE_COORDENADAS)
+	version = nueva_version(CLAVE_COORDENADAS)
+	if not vigente:
+		return
+
+	_indice.quitar(yacimiento)
+	for fila in filas_coordenadas(Coordenadas.objects.filter(yacimiento=yacimiento)):
+		_indice.agregar(Sitio(*fila))
+	_indice.version = version
+
+def alrededor(codigo, radio):
+	""" Retorna los yacimientos a menos de radio km del yacimiento con el codigo dado,
+	como lista de (distancia, sitio) ordenada, sin incluir al propio yacimiento """
+
+	punto = filas_coordenadas(Coordenadas.objects.filter(yacimiento__codigo=codigo))[:1]
+	if not punto:
+		return []
+
+	yacimiento, codigo, nombre, lat, lon = punto[0]
+	return [par for par in indice().en_radio(lat, lon, radio) if par[1].yacimiento != yacimiento]
@@ -0,0 +1,8 @@
+from django.conf.urls import patterns, url
+
+from geoespacial import views
+
+urlpatterns = patterns('',
+    url(r'^$', views.mapa, name='mapa'),
+    url(r'^marcadores$', views.marcadores, name='marcadores'),
+)
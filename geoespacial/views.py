@@ -1,13 +1,60 @@
 #coding: latin-1
 
-from anarapp.models import Yacimiento
-from django.http import HttpResponse
+import json
+
+from anarapp.models import Coordenadas
+from django.http import HttpResponse, HttpResponseBadRequest
 from django.shortcuts import render
 
-# Create your views here.
+from geoespacial.agrupamiento import agrupar
+from geoespacial import exportar
+
+def recuadro(norte, sur, este, oeste):
+    """ Retorna las coordenadas de los yacimientos dentro del recuadro dado, filtrando
+    en la base de datos por la posicion WGS 84 """
+
+    return Coordenadas.objects.filter(latitudWgs84__range = (sur, norte), longitudWgs84__range = (oeste, este))
 
 def mapa(request):
-    lista_de_yacimientos = Yacimiento.objects.all().order_by('nombre')
-    return render(request, 'geoespacial/mapa.html', {
-        'yacimientos':lista_de_yacimientos
-        })
+    return render(request, 'geoespacial/mapa.html')
+
+def marcadores(request):
+    """ Marcadores del recuadro visible del mapa: grupos con el total de yacimientos
+    por celda a poco zoom y yacimientos individuales al acercarse """
+
+    try:
+        norte = float(request.GET['norte'])
+        sur = float(request.GET['sur'])
+        este = float(request.GET['este'])
+        oeste = float(request.GET['oeste'])
+        zoom = int(request.GET['zoom'])
+    except (KeyError, ValueError):
+        return HttpResponseBadRequest('Parametros requeridos: norte, sur, este, oeste y zoom')
+
+    grupos, sueltos = agrupar(recuadro(norte, sur, este, oeste), zoom)
+
+    datos = {
+        'grupos': grupos,
+        'yacimientos': [{'latitud': p[0], 'longitud': p[1], 'codigo': p[2], 'nombre': p[3]} for p in sueltos],
+    }
+    return HttpResponse(json.dumps(datos), content_type='application/json')
+
+def _exportacion(request, formato, content_type, extension):
+    """ Respuesta que va generando el archivo mientras lee los yacimientos. Filtros
+    opcionales: estado, municipio y manifestacion (codigos, se puede repetir) """
+
+    try:
+        manifestaciones = [int(codigo) for codigo in request.GET.getlist('manifestacion')]
+    except ValueError:
+        return HttpResponseBadRequest('manifestacion debe ser un codigo numerico')
+
+    qs = exportar.consulta(request.GET.get('estado'), request.GET.get('municipio'), manifestaciones)
+    response = HttpResponse(formato(exportar.filas(qs)), content_type=content_type)
+    response['Content-Disposition'] = 'attachment; filename=sitios.%s' % extension
+    return response
+
+def sitios_geojson(request):
+    return _exportacion(request, exportar.geojson, 'application/vnd.geo+json', 'geojson')
+
+def sitios_kml(request):
+    return _exportacion(request, exportar.kml, 'application/vnd.google-earth.kml+xml', 'kml')
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+########################################################################################
+# Agregados por estado para los cruces
+# Cada reporte hace una sola consulta sobre ResumenYacimiento y reparte el resultado
+# por estado en una sola pasada, en lugar de una consulta por estado y categoria.
+########################################################################################
+
+from django.db.models import Count
+
+from anarapp.codigos import desde_mascara
+from anarapp.texto import clave
+
+def clave_estado(nombre):
+	""" Normaliza el nombre de un estado para comparar 'Bolívar', 'Bolivar' y 'BOLÍVAR' """
+
+	return clave(nombre).strip()
+
+def por_estado(filas, estados):
+	""" Reparte las filas en un diccionario nombre de estado -> lista de filas. Todos
+	los estados dados aparecen como clave; las filas de otros estados se descartan """
+
+	claves = dict((clave_estado(nombre), nombre) for nombre in estados)
+	resultado = dict((nombre, []) for nombre in estados)
+
+	for fila in filas:
+		nombre = claves.get(clave_estado(fila.estado))
+		if nombre is not None:
+			resultado[nombre].append(fila)
+
+	return resultado
+
+def cruzar_por_estado(qs, grupo, estados, etiquetas):
+	""" Cuenta, por estado, los yacimientos del queryset de resumenes que tienen cada
+	codigo del grupo. Las etiquetas son los nombres de los codigos 1, 2, ... en orden.
+	Usa una sola consulta agrupada por estado y mascara del grupo """
+
+	claves = dict((clave_estado(nombre), nombre) for nombre in estados)
+	resultado = dict((nombre, dict((etiqueta, 0) for etiqueta in etiquetas)) for nombre in estados)
+
+	filas = qs.order_by().values('estado', 'mascara_' + grupo).annotate(total=Count('id'))
+	for fila in filas:
+		nombre = claves.get(clave_estado(fila['estado']))
+		if nombre is None:
+			continue
+		for codigo in desde_mascara(fila['mascara_' + grupo]):
+			if codigo <= len(etiquetas):
+				resultado[nombre][etiquetas[codigo - 1]] += fila['total']
+
+	return resultado
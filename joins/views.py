@@ -1,10 +1,29 @@
 # -*- coding: utf-8 -*-
 
+import hashlib
+
+from django.core.cache import cache
 from django.http import HttpResponse
 from joins.forms import CrucesYYForm
 from django.shortcuts import render
 from haystack.query import SearchQuerySet
-from anarapp.models import Yacimiento
+from anarapp.models import Yacimiento, ResumenYacimiento
+from anarapp.versiones import version_datos
+from joins.agregados import por_estado, cruzar_por_estado
+
+# Reportes registrados: id del cruce -> (funcion, campos del formulario que necesita)
+CRUCES = {}
+
+def cruce(*ids, **opciones):
+    """ Registra la funcion decorada como el reporte de los cruces dados. El argumento
+    campos indica los campos de CrucesYYForm que el reporte necesita llenos """
+
+    campos = opciones.get('campos', ())
+    def registrar(funcion):
+        for cruce_id in ids:
+            CRUCES[cruce_id] = (funcion, campos)
+        return funcion
+    return registrar
 
 def index(request):
     form = CrucesYYForm()
@@ -54,6 +73,7 @@ MANIFESTACIONES = [
 ]
 
 #Cuentos y cuales yacimientos hay en estado
+@cruce(1, campos=('estado',))
 def cruce1(form):
     sqs = SearchQuerySet()
     sqs = sqs.filter(estado = form.cleaned_data['estado'])
@@ -65,6 +85,7 @@ def cruce1(form):
         'estado':estado, 
         'results':sqs}
 #Bibliografia
+@cruce(2, 3, 4, 5, 6, 7, campos=('codigo',))
 def cruce27(form):
     yacimiento = Yacimiento.objects.get(codigo = form.cleaned_data['codigo'])
     codigo = form.cleaned_data['codigo'] 
@@ -73,19 +94,17 @@ def cruce27(form):
         'yacimiento': yacimiento,
     }
 #Listar Dolmenes y menhires
+@cruce(8)
 def cruce8(form):
-    sqs = SearchQuerySet()
-    sqs = sqs.filter(pais = 'Venezuela').filter(tipo__in = [4, 5, 6, 7, 8])
-    total = sqs.count()
-    yacimientos = {}
-    for estado in ESTADOS:
-        lista = sqs.filter(estado = estado)
-        yacimientos[estado] = lista
+    resumenes = list(ResumenYacimiento.objects.filter(pais = 'Venezuela').con_alguno('tipo', [4, 5, 6, 7, 8]))
+    total = len(resumenes)
+    yacimientos = por_estado(resumenes, ESTADOS)
     return {
         'total' : total, 
         'yacimientos': yacimientos}
 
 #Numero de piedras trabajadas a numeros de piedra en el yacimiento original
+@cruce(9, campos=('estado',))
 def cruce9(form):
     sqs = SearchQuerySet()
     sqs = sqs.filter(estado = form.cleaned_data['estado'])
@@ -109,6 +128,7 @@ def cruce9(form):
         'yacimientos': sqs,
     }
 #Listar la manifestacion por estado
+@cruce(10, campos=('estado',))
 def cruce10(form):
     #Revizar que este en el estado seleccionado
     if form.cleaned_data['codigo'] != '':
@@ -141,38 +161,27 @@ def cruce10(form):
         'yacimientos': sqs}
 
 #Listar la manifestacion por ubicacion
+@cruce(11, campos=('ubicacion',))
 def cruce11(form):
     ubi = UBICACIONES.index(form.cleaned_data['ubicacion'])
-    sqs = SearchQuerySet()
-    sqs = sqs.filter(ubicacion = ubi).order_by('estado')
-    yacimientos = {}
-    for estado in ESTADOS:
-        lista = sqs.filter(estado = estado)
-        yacimientos[estado] = lista
-        ubicaciones = {}
-        for m in MANIFESTACIONES:
-            ubicaciones[m] = len(lista.filter(manifestacion = MANIFESTACIONES.index(m)))
-        yacimientos[estado] =  ubicaciones
+    resumenes = ResumenYacimiento.objects.con_alguno('ubicacion', [ubi] if ubi else [])
+    #Un solo conteo agrupado por estado y manifestacion
+    yacimientos = cruzar_por_estado(resumenes, 'manifestacion', ESTADOS, MANIFESTACIONES)
     return {
             'ubi' : form.cleaned_data['ubicacion'],
             'yacimientos': yacimientos}
 
 #listar ancho y profundidad de surco grabado, de petroglifos
+@cruce(12)
 def cruce12(form):
-    sqs = SearchQuerySet()
-    sqs = sqs.filter(pais = 'Venezuela').filter(manifestacion__in = [3, 4, 5])
-    yacimientos = {}
-    for estado in ESTADOS:
-        lista = sqs.filter(estado = estado)
-        yacimientos[estado] = lista
-        for l in lista:
-            l.carasurcopetroancho = l.carasurcopetroancho[0]
-            l.carasurcopetroprofun = l.carasurcopetroprofun[0]
+    resumenes = ResumenYacimiento.objects.filter(pais = 'Venezuela').con_alguno('manifestacion', [3, 4, 5])
+    yacimientos = por_estado(resumenes, ESTADOS)
 
     return { 
         'yacimientos': yacimientos}
 
 #Listar por estado los petroglifos con relieve
+@cruce(14, campos=('carasurcopetrotipo',))
 def cruce14(form):
     tipos = ['bajo relieve lineal',
     'bajo relieve planar',
@@ -214,19 +223,18 @@ def cruce14(form):
     if form.cleaned_data['carasurcopetrotipo'].lower() == tipos[9].lower():
         list.append(5)
         list.append(8)
-    sqs = SearchQuerySet()
-    sqs = sqs.filter(pais = 'Venezuela').filter(carasurcopetrotipo = list)
-    yacimientos = {}
-    total = sqs.count()
-    for estado in ESTADOS:
-        lista = sqs.filter(estado = estado)
-        yacimientos[estado] = lista
+    resumenes = ResumenYacimiento.objects.none()
+    if list:
+        resumenes = ResumenYacimiento.objects.filter(pais = 'Venezuela').con_todos('carasurcopetrotipo', list)
+    total = len(resumenes)
+    yacimientos = por_estado(resumenes, ESTADOS)
     return { 
     'total':total,
     'tipo':form.cleaned_data['carasurcopetrotipo'],
     'yacimientos': yacimientos}
 
 #petroglifos con aeras interlineadas
+@cruce(16, campos=('carasurcopetrotipo',))
 def cruce16(form):
     area = ['areas interlineales pulidas',
     'areas interlineales rebajadas',
@@ -251,6 +259,7 @@ def cruce16(form):
             'yacimientos': sqs}
 
 #Roca del petroglifo
+@cruce(17, campos=('material',))
 def cruce17(form):
     value = ''
     filters = ['roca ignea',
@@ -268,7 +277,7 @@ def cruce17(form):
     if list[0] <=3 and 1 <= list[0]:
         value = 'material'
     else:
-        value == 'conservacion'
+        value = 'conservacion'
         list[0] = list[0] -1
 
     '''if form.cleaned_data['material'].lower() == filters[0].lower:
@@ -293,17 +302,14 @@ def cruce17(form):
         value = 'conservacion'
         list.append(6)'''
 
-    sqs = SearchQuerySet()
-    sqs = sqs.filter(pais = 'Venezuela').filter(value = list,manifestacion__in = [3,4,5])
-    yacimientos = {}
-    for estado in ESTADOS:
-        lista = sqs.filter(estado = estado)
-        yacimientos[estado] = lista
+    resumenes = ResumenYacimiento.objects.filter(pais = 'Venezuela').con_alguno(value, list).con_alguno('manifestacion', [3,4,5])
+    yacimientos = por_estado(resumenes, ESTADOS)
     return {
     'tipo':form.cleaned_data['material'],
     'yacimientos': yacimientos}
 
 #Mafinistacion asociada a litica,ceramica, osea,etc
+@cruce(19, campos=('manifasociadas',))
 def cruce19(form):
     filters = ['litica',
     'ceramica',
@@ -318,13 +324,8 @@ def cruce19(form):
     list = 0
     try:
         list = filters.index(form.cleaned_data['manifasociadas'].lower()) + 1
-        sqs = SearchQuerySet()
-        sqs = sqs.filter(pais = 'Venezuela').filter(manifasociadas = list)
-        yacimientos = {}
-        lista = []
-        for estado in ESTADOS:
-            lista = sqs.filter(estado = estado)
-            yacimientos[estado] = lista
+        resumenes = ResumenYacimiento.objects.filter(pais = 'Venezuela').con_alguno('manifasociadas', [list])
+        yacimientos = por_estado(resumenes, ESTADOS)
         return {
         'manifa':form.cleaned_data['manifasociadas'],
         'yacimientos': yacimientos}
@@ -333,48 +334,46 @@ def cruce19(form):
         return {}
 
 #proporcion de piedra en petroglifos y ubicacion
+@cruce(20, campos=('ubicacion',))
 def cruce20(form):
   ubi = UBICACIONES.index(form.cleaned_data['ubicacion'])
-  sqs = SearchQuerySet()
-  sqs = sqs.filter(ubicacion = ubi, manifestacion__in = [3, 4, 5]).order_by('estado')
+  resumenes = ResumenYacimiento.objects.con_alguno('ubicacion', [ubi] if ubi else []).con_alguno('manifestacion', [3, 4, 5])
+  #La plantilla lee la constitucion de cada yacimiento, se trae en la misma consulta
+  resumenes = resumenes.select_related('yacimiento__ConstitucionYacimiento')
   yacimientos = {}
-  for estado in ESTADOS:
-    lista = sqs.filter(estado = estado)
-    yacimientos[estado] = lista
+  for estado, lista in por_estado(resumenes, ESTADOS).items():
+    yacimientos[estado] = [r.yacimiento for r in lista]
   return {
     'yacimientos':yacimientos,
     'ubica':form.cleaned_data['ubicacion']}
   
 
 
+def clave_cruce(cruce_id, datos):
+    """ Clave de cache del reporte: version de los datos, id del cruce y valores del
+    formulario sin espacios sobrantes """
+
+    valores = sorted((campo, (valor or u'').strip()) for campo, valor in datos.items())
+    resumen = hashlib.md5(repr(valores)).hexdigest()
+    return 'cruce:%s:%s:%s' % (version_datos(), int(cruce_id), resumen)
+
 def cruces(request, cruce_id):
     form = CrucesYYForm(request.GET)
-    if form.is_valid():
-        functions = {1:cruce1,
-        2:cruce27,
-        3:cruce27,
-        4:cruce27,
-        5:cruce27,
-        6:cruce27,
-        7:cruce27,
-        8:cruce8,
-        9:cruce9,
-        10:cruce10,
-        11:cruce11,
-        12:cruce12,
-        13:render(request, 'joins/index.html', {'form' : form}),
-        14:cruce14,
-        15:render(request, 'joins/index.html', {'form' : form}),
-        16:cruce16,
-        17:cruce17,
-        18:render(request, 'joins/index.html', {'form' : form}),
-        19:cruce19,
-        20:cruce20
-        }
-        if(cruce_id == '13' or cruce_id == '15' or cruce_id == 18):
-           return render(request, 'joins/index.html', {'form' : form})
-        func = functions[int(cruce_id)]
-        dic = func(form)
-        return render(request,'joins/cruce'+cruce_id+'.html',dic)
+    registro = CRUCES.get(int(cruce_id))
+
+    #Los cruces sin reporte (13, 15 y 18) o sin los datos necesarios vuelven al formulario
+    if registro is None or not form.is_valid():
+        return render(request, 'joins/index.html', {'form' : form})
 
-    
\ No newline at end of file
+    func, campos = registro
+    if any(not form.cleaned_data.get(campo) for campo in campos):
+        return render(request, 'joins/index.html', {'form' : form})
+
+    #Los reportes solo cambian cuando se edita una ficha, se sirven de la cache
+    clave = clave_cruce(cruce_id, form.cleaned_data)
+    contenido = cache.get(clave)
+    if contenido is None:
+        dic = func(form)
+        contenido = render(request,'joins/cruce'+cruce_id+'.html',dic).content
+        cache.set(clave, contenido)
+    return HttpResponse(contenido)